@@ -15,7 +15,6 @@ from dim_mod_sim.events.generator import EventGenerator
 from dim_mod_sim.evaluator.engine import SchemaEvaluator
 from dim_mod_sim.evaluator.feedback import ActionableFeedback, ViolationType
 from dim_mod_sim.explain.analyzer import SchemaAnalyzer
-from dim_mod_sim.play.session import PlaySession
 from dim_mod_sim.scaffold.generator import ScaffoldGenerator
 from dim_mod_sim.schema.parser import parse_schema
 from dim_mod_sim.shop.config import ShopConfiguration
@@ -78,8 +77,7 @@ def generate(
 
     # Save configuration
     config_path = output_dir / "shop_config.json"
-    with open(config_path, "w") as f:
-        json.dump(config.model_dump(mode="json"), f, indent=2)
+    config_path.write_text(config.model_dump_json(indent=2))
     console.print(f"[green]✓[/green] Shop configuration saved to {config_path}")
 
     # Generate events
@@ -90,7 +88,7 @@ def generate(
     # Save events
     events_path = output_dir / "events.json"
     with open(events_path, "w") as f:
-        json.dump(events.to_dict(), f, indent=2)
+        events.write_json(f)
     console.print(f"[green]✓[/green] Events saved to {events_path} ({len(events.events)} events)")
 
     # Generate description
@@ -546,6 +544,8 @@ def play(
         raise typer.Exit(1)
 
     # Run the play session
+    from dim_mod_sim.play.session import PlaySession
+
     session = PlaySession(
         seed=seed,
         difficulty=diff,
@@ -37,13 +37,32 @@ class SeededRandom:
         """Return a random integer in [min_val, max_val]."""
         return self._rng.randint(min_val, max_val)
 
+    def integers(self, min_val: int, max_val: int, k: int) -> list[int]:
+        """Return k random integers, each in [min_val, max_val]."""
+        randint = self._rng.randint
+        return [randint(min_val, max_val) for _ in range(k)]
+
+    def booleans(self, true_probability: float, k: int) -> list[bool]:
+        """Return k booleans, each True with the given probability."""
+        random = self._rng.random
+        return [random() < true_probability for _ in range(k)]
+
+    def floats(self, k: int) -> list[float]:
+        """Return k random floats, each in [0.0, 1.0)."""
+        random = self._rng.random
+        return [random() for _ in range(k)]
+
     def uniform(self, min_val: float, max_val: float) -> float:
         """Return a random float in [min_val, max_val]."""
         return self._rng.uniform(min_val, max_val)
 
     def sample(self, seq: Sequence[T], k: int) -> list[T]:
-        """Return k unique random elements from sequence."""
-        return self._rng.sample(list(seq), k)
+        """Return k unique random elements from sequence.
+
+        The sequence is sampled in place (no copy), so a ``range`` can be
+        passed to sample indices cheaply.
+        """
+        return self._rng.sample(seq, k)
 
     def shuffle(self, seq: list[T]) -> None:
         """Shuffle sequence in place."""
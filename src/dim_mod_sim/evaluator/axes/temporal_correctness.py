@@ -5,6 +5,9 @@ from dim_mod_sim.evaluator.feedback import ViolationType
 from dim_mod_sim.evaluator.result import AxisScore, Deduction, Severity
 from dim_mod_sim.schema.models import DimensionTable, SCDType, SchemaSubmission
 
+# Maximum number of dimension names spelled out in a single deduction reason
+MAX_LISTED_DIMS = 10
+
 
 class TemporalCorrectnessAxis(EvaluationAxis):
     """Evaluates temporal handling and SCD strategies."""
@@ -111,18 +114,18 @@ class TemporalCorrectnessAxis(EvaluationAxis):
         deductions = []
 
         # Late-arriving facts need dimension records to exist
-        # Type 2 dimensions with surrogate keys can handle this
-        problem_dims = []
-
-        for dim in submission.dimension_tables:
-            # Dimensions using natural keys only may have issues
-            if not dim.surrogate_key:
-                problem_dims.append(dim.name)
+        # Type 2 dimensions with surrogate keys can handle this.
+        # Dimensions using natural keys only may have issues.
+        problem_dims = [dim.name for dim in submission.dimension_tables if not dim.surrogate_key]
 
         if problem_dims:
+            # Keep the reason string bounded for very wide schemas
+            shown = f"{problem_dims[:MAX_LISTED_DIMS]}"
+            if len(problem_dims) > MAX_LISTED_DIMS:
+                shown += f" (+{len(problem_dims) - MAX_LISTED_DIMS} more)"
             deductions.append(Deduction(
                 points=10,
-                reason=f"Late-arriving events may cause issues with dimensions lacking surrogate keys: {problem_dims}",
+                reason=f"Late-arriving events may cause issues with dimensions lacking surrogate keys: {shown}",
                 severity=Severity.MODERATE,
                 affected_elements=problem_dims,
             ))
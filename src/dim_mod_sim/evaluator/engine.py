@@ -11,7 +11,7 @@ from dim_mod_sim.evaluator.axes import (
     StructuralOptimalityAxis,
     TemporalCorrectnessAxis,
 )
-from dim_mod_sim.evaluator.result import AxisScore, EvaluationResult
+from dim_mod_sim.evaluator.result import AxisScore, EvaluationResult, Severity
 from dim_mod_sim.schema.models import SchemaSubmission
 from dim_mod_sim.shop.config import ShopConfiguration
 
@@ -42,13 +42,16 @@ class SchemaEvaluator:
             QueryabilityAxis(self.context),
         ]
 
+        # Everything that depends only on config/events is resolved here, once
+        # per evaluator, so evaluate() only does per-submission work
+        self._axis_evaluators = tuple((axis.name, axis.evaluate) for axis in self.axes)
+        self._config_recommendations = self._generate_config_recommendations()
+
     def evaluate(self, submission: SchemaSubmission) -> EvaluationResult:
         """Evaluate a schema submission."""
-        axis_scores: dict[str, AxisScore] = {}
-
-        for axis in self.axes:
-            score = axis.evaluate(submission)
-            axis_scores[axis.name] = score
+        axis_scores: dict[str, AxisScore] = {
+            name: evaluate(submission) for name, evaluate in self._axis_evaluators
+        }
 
         total_score = sum(s.score for s in axis_scores.values())
         max_score = sum(s.max_score for s in axis_scores.values())
@@ -89,7 +92,7 @@ class SchemaEvaluator:
         critical_issues = []
         for axis_name, score in axis_scores.items():
             for ded in score.deductions:
-                if ded.severity.value == "critical":
+                if ded.severity is Severity.CRITICAL:
                     critical_issues.append((axis_name, ded))
 
         if critical_issues:
@@ -102,7 +105,7 @@ class SchemaEvaluator:
         major_issues = []
         for axis_name, score in axis_scores.items():
             for ded in score.deductions:
-                if ded.severity.value == "major":
+                if ded.severity is Severity.MAJOR:
                     major_issues.append((axis_name, ded))
 
         if major_issues:
@@ -148,8 +151,8 @@ class SchemaEvaluator:
         for axis_name, score in sorted_axes:
             if score.percentage < 70:
                 # Get the most impactful deduction
-                critical_deds = [d for d in score.deductions if d.severity.value == "critical"]
-                major_deds = [d for d in score.deductions if d.severity.value == "major"]
+                critical_deds = [d for d in score.deductions if d.severity is Severity.CRITICAL]
+                major_deds = [d for d in score.deductions if d.severity is Severity.MAJOR]
 
                 if critical_deds:
                     ded = critical_deds[0]
@@ -159,6 +162,14 @@ class SchemaEvaluator:
                     recommendations.append(f"[{axis_name}] Address: {ded.reason}")
 
         # Add general recommendations based on config
+        recommendations.extend(self._config_recommendations)
+
+        return recommendations[:5]  # Top 5 recommendations
+
+    def _generate_config_recommendations(self) -> list[str]:
+        """General recommendations that follow from the shop configuration alone."""
+        recommendations = []
+
         if self.config.time.backdated_corrections:
             recommendations.append(
                 "Ensure fact tables distinguish event_timestamp from business_effective_date"
@@ -169,4 +180,4 @@ class SchemaEvaluator:
                 "Consider separate fact tables for line-item vs aggregated transactions"
             )
 
-        return recommendations[:5]  # Top 5 recommendations
+        return recommendations
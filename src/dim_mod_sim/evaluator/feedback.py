@@ -1,5 +1,6 @@
 """Actionable feedback models for schema evaluation."""
 
+import re
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -28,6 +29,19 @@ AXIS_TO_VIOLATION_TYPE: dict[str, ViolationType] = {
     "queryability": ViolationType.UNDER_MODELING,
 }
 
+# Keywords in a deduction reason that select generated example/consequence/fix text
+_CATEGORY_RE = re.compile(
+    r"(?P<grain>grain)|(?P<scd>scd)|(?P<history>history)|(?P<type_1>type_1)"
+    r"|(?P<returns>return)|(?P<payment>payment)|(?P<customer>customer)"
+    r"|(?P<anonymous>anonymous)|(?P<inventory>inventory)|(?P<missing>missing|no )"
+)
+
+# Axes whose deductions always fall into a category, whatever the reason says
+_AXIS_CATEGORIES: dict[str, str] = {
+    "grain_correctness": "grain",
+    "temporal_correctness": "temporal",
+}
+
 
 @dataclass
 class ConcreteViolation:
@@ -47,21 +61,29 @@ class ConcreteViolation:
         cls,
         deduction: Deduction,
         axis_name: str,
+        default_vtype: ViolationType | None = None,
     ) -> "ConcreteViolation":
-        """Create a ConcreteViolation from an existing Deduction."""
+        """Create a ConcreteViolation from an existing Deduction.
+
+        Callers converting many deductions from the same axis can pass the
+        axis's default violation type to skip the per-deduction lookup.
+        """
         # Use extended fields if present, otherwise generate defaults
-        violation_type = (
-            deduction.violation_type
-            if deduction.violation_type
-            else AXIS_TO_VIOLATION_TYPE.get(axis_name, ViolationType.SEMANTIC_MISMATCH)
-        )
+        violation_type = deduction.violation_type
+        if not violation_type:
+            violation_type = default_vtype or AXIS_TO_VIOLATION_TYPE.get(
+                axis_name, ViolationType.SEMANTIC_MISMATCH
+            )
+
+        reason = deduction.reason.lower()
+        categories = _classify(reason, axis_name)
 
         return cls(
             violation_type=violation_type,
             what_went_wrong=deduction.reason,
-            concrete_example=deduction.concrete_example or _generate_example(deduction, axis_name),
-            consequence=deduction.consequence or _generate_consequence(deduction, axis_name),
-            fix_hint=deduction.fix_hint or _generate_fix_hint(deduction, axis_name),
+            concrete_example=deduction.concrete_example or _generate_example(reason, categories),
+            consequence=deduction.consequence or _generate_consequence(reason, categories),
+            fix_hint=deduction.fix_hint or _generate_fix_hint(reason, categories),
             affected_tables=deduction.affected_elements,
             severity=deduction.severity,
             points_deducted=deduction.points,
@@ -88,8 +110,9 @@ class ActionableFeedback:
 
         # Collect all violations from all axes
         for axis_name, axis_score in result.axis_scores.items():
+            default_vtype = AXIS_TO_VIOLATION_TYPE.get(axis_name, ViolationType.SEMANTIC_MISMATCH)
             for deduction in axis_score.deductions:
-                violation = ConcreteViolation.from_deduction(deduction, axis_name)
+                violation = ConcreteViolation.from_deduction(deduction, axis_name, default_vtype)
                 violations.append(violation)
 
                 if violation.violation_type not in by_category:
@@ -122,63 +145,70 @@ class ActionableFeedback:
         )
 
 
-def _generate_example(deduction: Deduction, axis_name: str) -> str:
-    """Generate a concrete example based on the deduction."""
-    reason = deduction.reason.lower()
+def _classify(reason: str, axis_name: str) -> frozenset[str]:
+    """Collect the reason keywords (and axis hints) that drive generated feedback.
 
-    if "grain" in reason or axis_name == "grain_correctness":
+    A single regex pass replaces the repeated substring scans previously done
+    by each of the example/consequence/fix generators.
+    """
+    categories = {m.lastgroup for m in _CATEGORY_RE.finditer(reason)}
+    axis_category = _AXIS_CATEGORIES.get(axis_name)
+    if axis_category:
+        categories.add(axis_category)
+    return frozenset(categories)
+
+
+def _generate_example(reason: str, categories: frozenset[str]) -> str:
+    """Generate a concrete example based on the deduction."""
+    if "grain" in categories:
         if "mixed" in reason:
             return "Transaction TXN-001 has line items; TXN-002 is receipt-level only"
         if "many-to-many" in reason:
             return "Customer C-100 applies 3 promotions; all 3 rows appear in query output"
         return "The fact table grain is ambiguous for certain events"
 
-    if "scd" in reason or "history" in reason or axis_name == "temporal_correctness":
+    if not categories.isdisjoint(("scd", "history", "temporal")):
         return "SKU-123 was in 'Electronics' in January, moved to 'Clearance' in February"
 
-    if "return" in reason:
+    if "returns" in categories:
         return "Return RET-500 has no original_transaction_id - cannot trace to sale"
 
-    if "payment" in reason:
+    if "payment" in categories:
         return "Transaction TXN-200 split across cash and credit card"
 
-    if "customer" in reason or "anonymous" in reason:
+    if not categories.isdisjoint(("customer", "anonymous")):
         return "15% of transactions have null or unreliable customer identifiers"
 
     return ""
 
 
-def _generate_consequence(deduction: Deduction, axis_name: str) -> str:
+def _generate_consequence(reason: str, categories: frozenset[str]) -> str:
     """Generate consequence description based on the deduction."""
-    reason = deduction.reason.lower()
-
-    if "grain" in reason or axis_name == "grain_correctness":
+    if "grain" in categories:
         if "mixed" in reason:
             return "SUM(quantity) will double-count or lose items. Aggregate queries are unreliable."
         if "many-to-many" in reason:
             return "Joining without a bridge table causes fan-out, inflating all measures."
         return "Queries may produce inconsistent or incorrect aggregations"
 
-    if "scd" in reason or "history" in reason or axis_name == "temporal_correctness":
+    if not categories.isdisjoint(("scd", "history", "temporal")):
         return "Historical reports show current values, not point-in-time truth"
 
-    if "return" in reason:
+    if "returns" in categories:
         return "Cannot calculate true customer lifetime value or accurate refund rates"
 
-    if "payment" in reason:
+    if "payment" in categories:
         return "Cannot analyze payment method trends or reconcile transactions accurately"
 
-    if "missing" in reason or "no " in reason:
+    if "missing" in categories:
         return "Business requirement cannot be answered by this model"
 
     return "Query results will be incorrect or incomplete for some business questions"
 
 
-def _generate_fix_hint(deduction: Deduction, axis_name: str) -> str:
+def _generate_fix_hint(reason: str, categories: frozenset[str]) -> str:
     """Generate fix hint based on the deduction."""
-    reason = deduction.reason.lower()
-
-    if "grain" in reason or axis_name == "grain_correctness":
+    if "grain" in categories:
         if "mixed" in reason:
             return "Split into separate fact tables per grain, or add is_aggregated indicator"
         if "many-to-many" in reason:
@@ -187,23 +217,23 @@ def _generate_fix_hint(deduction: Deduction, axis_name: str) -> str:
             return "Add a clear grain_description stating exactly what one row represents"
         return "Clarify the grain and ensure all grain columns are properly defined"
 
-    if "scd" in reason or "type_1" in reason or axis_name == "temporal_correctness":
+    if not categories.isdisjoint(("scd", "type_1", "temporal")):
         return "Change to Type 2 SCD and mark changing attributes with scd_tracked: true"
 
-    if "return" in reason:
+    if "returns" in categories:
         if "reference" in reason:
             return "Add nullable original_transaction_id FK, or model orphan returns separately"
         return "Add a returns fact table to capture return events"
 
-    if "payment" in reason:
+    if "payment" in categories:
         return "Add a payments fact table or payment bridge table for multiple payments"
 
-    if "customer" in reason:
+    if "customer" in categories:
         if "no customer" in reason or "missing" in reason:
             return "Add a customer dimension with proper handling of anonymous customers"
         return "Review customer dimension design for this shop's ID reliability"
 
-    if "inventory" in reason:
+    if "inventory" in categories:
         return "Add an inventory fact table matching the shop's tracking method"
 
     return "Review the schema against shop configuration requirements"
@@ -215,18 +245,21 @@ def _generate_fix_priority(violations: list[ConcreteViolation]) -> list[str]:
     seen_types: set[ViolationType] = set()
 
     for v in violations:
-        if v.violation_type in seen_types:
+        vtype = v.violation_type
+        if vtype in seen_types:
             continue
-        seen_types.add(v.violation_type)
+        seen_types.add(vtype)
 
-        if v.severity == Severity.CRITICAL:
+        severity = v.severity
+        if severity is Severity.CRITICAL:
             impact = "(breaks queries)"
-        elif v.severity == Severity.MAJOR:
+        elif severity is Severity.MAJOR:
             impact = "(significant data issues)"
         else:
             impact = ""
 
-        tables = ", ".join(v.affected_tables[:2]) if v.affected_tables else "schema"
+        affected = v.affected_tables
+        tables = ", ".join(affected[:2]) if affected else "schema"
         priority.append(f"{v.fix_hint} [{tables}] {impact}".strip())
 
         if len(priority) >= 5:
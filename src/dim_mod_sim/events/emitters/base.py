@@ -1,6 +1,7 @@
 """Base class for event emitters."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 
 from dim_mod_sim.core.random import SeededRandom
 from dim_mod_sim.events.models import BaseEvent
@@ -16,8 +17,12 @@ class EventEmitter(ABC):
         self.rng = rng
 
     @abstractmethod
-    def emit(self, state: WorldState) -> list[BaseEvent]:
-        """Generate events based on current world state."""
+    def emit(self, state: WorldState) -> Iterator[BaseEvent]:
+        """Generate events based on current world state.
+
+        Implementations are generators, so emitters with nothing to emit
+        cost no list allocation.
+        """
         pass
 
     @abstractmethod
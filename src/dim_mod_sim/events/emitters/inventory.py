@@ -1,5 +1,7 @@
 """Inventory event emitter."""
 
+from collections.abc import Iterator
+
 from dim_mod_sim.core.random import SeededRandom
 from dim_mod_sim.events.emitters.base import EventEmitter
 from dim_mod_sim.events.models import (
@@ -8,12 +10,12 @@ from dim_mod_sim.events.models import (
     InventoryAdjustmentEvent,
     InventorySnapshotEvent,
 )
-from dim_mod_sim.events.state import WorldState
+from dim_mod_sim.events.state import EVENT_ID_PREFIX, WorldState
 from dim_mod_sim.shop.config import ShopConfiguration
 from dim_mod_sim.shop.options import InventoryType
 
 
-ADJUSTMENT_REASONS = [
+ADJUSTMENT_REASONS = (
     "receiving",
     "damage",
     "theft",
@@ -22,7 +24,7 @@ ADJUSTMENT_REASONS = [
     "transfer_out",
     "expired",
     "return_to_vendor",
-]
+)
 
 
 class InventoryEventEmitter(EventEmitter):
@@ -39,57 +41,52 @@ class InventoryEventEmitter(EventEmitter):
 
         inv_type = self.config.inventory.inventory_type
 
-        # For transactional, emit adjustments periodically
-        if inv_type in (InventoryType.TRANSACTIONAL, InventoryType.BOTH):
-            if self.rng.boolean(0.05):  # 5% chance per tick
-                return True
-
-        # For snapshots, emit at end of day
+        # For snapshots, emit at end of day (checked first: no RNG draw needed)
         if inv_type in (InventoryType.PERIODIC_SNAPSHOT, InventoryType.BOTH):
             if (
                 self._last_snapshot_date != state.current_business_date
-                and state.current_timestamp.hour >= 22
+                and state.current_hour >= 22
             ):
                 return True
 
+        # For transactional, emit adjustments periodically
+        if inv_type in (InventoryType.TRANSACTIONAL, InventoryType.BOTH):
+            if self.rng.boolean(0.05):  # 5% chance per tick
+                return True
+
         return False
 
-    def emit(self, state: WorldState) -> list[BaseEvent]:
+    def emit(self, state: WorldState) -> Iterator[BaseEvent]:
         """Generate inventory events."""
-        events: list[BaseEvent] = []
-
         if not self.config.inventory.tracked:
-            return events
+            return
 
         inv_type = self.config.inventory.inventory_type
+        business_date = state.current_business_date
 
         # Check if we should do a snapshot
         should_snapshot = (
             inv_type in (InventoryType.PERIODIC_SNAPSHOT, InventoryType.BOTH)
-            and self._last_snapshot_date != state.current_business_date
-            and state.current_timestamp.hour >= 22
+            and self._last_snapshot_date != business_date
+            and state.current_hour >= 22
         )
 
         if should_snapshot:
-            events.extend(self._emit_snapshots(state))
-            self._last_snapshot_date = state.current_business_date
+            yield from self._emit_snapshots(state)
+            self._last_snapshot_date = business_date
         elif inv_type in (InventoryType.TRANSACTIONAL, InventoryType.BOTH):
-            events.extend(self._emit_adjustment(state))
+            yield from self._emit_adjustment(state)
 
-        return events
-
-    def _emit_adjustment(self, state: WorldState) -> list[BaseEvent]:
+    def _emit_adjustment(self, state: WorldState) -> Iterator[BaseEvent]:
         """Emit an inventory adjustment event."""
-        events: list[BaseEvent] = []
-
         open_stores = state.get_open_stores()
         if not open_stores:
-            return events
+            return
 
         store = self.rng.choice(open_stores)
         active_products = state.get_active_products()
         if not active_products:
-            return events
+            return
 
         product = self.rng.choice(active_products)
         reason = self.rng.choice(ADJUSTMENT_REASONS)
@@ -105,39 +102,53 @@ class InventoryEventEmitter(EventEmitter):
         # Update state
         state.update_inventory(store.store_id, product.sku, quantity_change)
 
-        events.append(InventoryAdjustmentEvent(
-            event_id=state.generate_event_id(),
+        event_id, adjustment_id = state.generate_tagged_id("ADJ")
+        yield InventoryAdjustmentEvent(
+            event_id=event_id,
             event_type=EventType.INVENTORY_ADJUSTMENT,
             event_timestamp=state.current_timestamp,
             business_effective_date=state.current_business_date,
-            adjustment_id=f"ADJ-{state._event_sequence:08d}",
+            adjustment_id=adjustment_id,
             store_id=store.store_id,
             sku=product.sku,
             quantity_change=quantity_change,
             reason_code=reason,
             reference_event_id=None,
-        ))
-
-        return events
+        )
 
     def _emit_snapshots(self, state: WorldState) -> list[BaseEvent]:
         """Emit inventory snapshots for all store/SKU combinations."""
-        events: list[BaseEvent] = []
-
-        snapshot_type = "daily"
-
-        for store_id, store_inv in state.inventory.items():
-            for sku, quantity in store_inv.items():
-                events.append(InventorySnapshotEvent(
-                    event_id=state.generate_event_id(),
-                    event_type=EventType.INVENTORY_SNAPSHOT,
-                    event_timestamp=state.current_timestamp,
-                    business_effective_date=state.current_business_date,
-                    snapshot_id=f"SNAP-{state._event_sequence:08d}",
-                    store_id=store_id,
-                    sku=sku,
-                    quantity_on_hand=quantity,
-                    snapshot_type=snapshot_type,
-                ))
-
-        return events
+        total = sum(len(store_inv) for store_inv in state.inventory.values())
+        if not total:
+            return []
+
+        # One sequence bump for the whole batch instead of one per snapshot
+        base = state.reserve_event_ids(total)
+
+        timestamp = state.current_timestamp
+        business_date = state.current_business_date
+
+        event_type = EventType.INVENTORY_SNAPSHOT
+
+        # Each sequence number is formatted once and shared by both IDs
+        return [
+            InventorySnapshotEvent(
+                event_id=EVENT_ID_PREFIX + digits,
+                event_type=event_type,
+                event_timestamp=timestamp,
+                business_effective_date=business_date,
+                snapshot_id="SNAP-" + digits,
+                store_id=store_id,
+                sku=sku,
+                quantity_on_hand=quantity,
+                snapshot_type="daily",
+            )
+            for digits, (store_id, sku, quantity) in zip(
+                (str(seq).zfill(8) for seq in range(base + 1, base + total + 1)),
+                (
+                    (store_id, sku, quantity)
+                    for store_id, store_inv in state.inventory.items()
+                    for sku, quantity in store_inv.items()
+                ),
+            )
+        ]
@@ -1,5 +1,7 @@
 """Return event emitter."""
 
+from collections.abc import Callable, Iterator
+
 from dim_mod_sim.core.random import SeededRandom
 from dim_mod_sim.events.emitters.base import EventEmitter
 from dim_mod_sim.events.models import (
@@ -8,12 +10,12 @@ from dim_mod_sim.events.models import (
     LineItem,
     ReturnEvent,
 )
-from dim_mod_sim.events.state import WorldState
+from dim_mod_sim.events.state import ProductState, WorldState
 from dim_mod_sim.shop.config import ShopConfiguration
 from dim_mod_sim.shop.options import ReturnsPricingPolicy, ReturnsReferencePolicy
 
 
-RETURN_REASONS = [
+RETURN_REASONS = (
     "defective",
     "wrong_item",
     "changed_mind",
@@ -22,7 +24,7 @@ RETURN_REASONS = [
     "too_small",
     "too_large",
     "better_price_elsewhere",
-]
+)
 
 
 class ReturnEventEmitter(EventEmitter):
@@ -30,6 +32,14 @@ class ReturnEventEmitter(EventEmitter):
 
     def __init__(self, config: ShopConfiguration, rng: SeededRandom) -> None:
         super().__init__(config, rng)
+        # Refund unit price for a referenced line item, by pricing policy
+        self._price_handlers: dict[
+            ReturnsPricingPolicy, Callable[[LineItem, ProductState | None], int]
+        ] = {
+            ReturnsPricingPolicy.ORIGINAL_PRICE: self._original_price,
+            ReturnsPricingPolicy.CURRENT_PRICE: self._current_price,
+            ReturnsPricingPolicy.ARBITRARY_OVERRIDE: self._override_price,
+        }
 
     def should_emit(self, state: WorldState) -> bool:
         """Returns can happen if there are transactions to return."""
@@ -38,14 +48,12 @@ class ReturnEventEmitter(EventEmitter):
         # Returns are less frequent than sales
         return self.rng.boolean(0.15)
 
-    def emit(self, state: WorldState) -> list[BaseEvent]:
+    def emit(self, state: WorldState) -> Iterator[BaseEvent]:
         """Generate a return event."""
-        events: list[BaseEvent] = []
-
         # Select store
         open_stores = state.get_open_stores()
         if not open_stores:
-            return events
+            return
 
         store = self.rng.choice(open_stores)
         register = self.rng.choice(store.registers)
@@ -54,7 +62,7 @@ class ReturnEventEmitter(EventEmitter):
         # Get returnable transactions
         returnable = state.get_returnable_transactions(store.store_id)
         if not returnable:
-            return events
+            return
 
         # Determine if we reference original transaction
         original_txn_id: str | None = None
@@ -73,7 +81,7 @@ class ReturnEventEmitter(EventEmitter):
         # Generate return line items
         line_items = self._generate_return_items(state, original_sale, store.store_id)
         if not line_items:
-            return events
+            return
 
         # Determine price determination method
         pricing = self.config.returns.pricing_policy
@@ -91,18 +99,19 @@ class ReturnEventEmitter(EventEmitter):
         else:
             customer_id = state.get_or_create_customer()
 
+        event_id, return_id = state.generate_tagged_id("RET")
         return_event = ReturnEvent(
-            event_id=state.generate_event_id(),
+            event_id=event_id,
             event_type=EventType.RETURN,
             event_timestamp=state.current_timestamp,
             business_effective_date=state.current_business_date,
-            return_id=f"RET-{state._event_sequence:08d}",
+            return_id=return_id,
             store_id=store.store_id,
             register_id=register,
             employee_id=employee,
             customer_id=customer_id,
             original_transaction_id=original_txn_id,
-            line_items=tuple(line_items),
+            line_items=line_items,
             return_reason_code=self.rng.choice(RETURN_REASONS),
             price_determination=price_determination,
         )
@@ -111,78 +120,72 @@ class ReturnEventEmitter(EventEmitter):
         for li in line_items:
             state.update_inventory(store.store_id, li.sku, li.quantity)
 
-        events.append(return_event)
-        return events
+        yield return_event
 
     def _generate_return_items(
         self,
         state: WorldState,
         original_sale: "SaleEvent | None",
         store_id: str,
-    ) -> list[LineItem]:
+    ) -> tuple[LineItem, ...]:
         """Generate line items for a return."""
-        line_items: list[LineItem] = []
+        pricing = self.config.returns.pricing_policy
+        rng_integer = self.rng.integer
 
         if original_sale and not original_sale.is_aggregated:
             # Return some items from the original sale
-            num_items = self.rng.integer(1, len(original_sale.line_items))
-            items_to_return = self.rng.sample(list(original_sale.line_items), num_items)
-
-            for i, orig_item in enumerate(items_to_return):
-                # Might return less than originally purchased
-                quantity = self.rng.integer(1, orig_item.quantity)
-
-                # Determine price based on policy
-                pricing = self.config.returns.pricing_policy
-                if pricing == ReturnsPricingPolicy.ORIGINAL_PRICE:
-                    unit_price = orig_item.unit_price_cents
-                elif pricing == ReturnsPricingPolicy.CURRENT_PRICE:
-                    # Get current price from product
-                    product = state.products.get(orig_item.sku)
-                    unit_price = product.current_price_cents if product else orig_item.unit_price_cents
-                else:
-                    # Arbitrary override
-                    unit_price = self.rng.integer(
-                        orig_item.unit_price_cents // 2,
-                        orig_item.unit_price_cents,
-                    )
-
-                line_items.append(LineItem(
+            original_items = original_sale.line_items
+            num_items = rng_integer(1, len(original_items))
+            indices = self.rng.sample(range(len(original_items)), num_items)
+            products = state.products
+            unit_price = self._price_handlers[pricing]
+
+            return tuple(
+                LineItem(
                     line_number=i + 1,
                     sku=orig_item.sku,
-                    quantity=quantity,
-                    unit_price_cents=unit_price,
+                    # Might return less than originally purchased
+                    quantity=rng_integer(1, orig_item.quantity),
+                    unit_price_cents=unit_price(orig_item, products.get(orig_item.sku)),
                     discount_cents=0,  # Returns typically don't have discounts
                     promotion_codes=(),
-                ))
-        else:
-            # No original reference or aggregated - generate arbitrary return
-            active_products = state.get_active_products()
-            if not active_products:
-                return line_items
-
-            num_items = self.rng.integer(1, 3)
-            for i in range(num_items):
-                product = self.rng.choice(active_products)
-                quantity = self.rng.integer(1, 3)
-
-                # Price determination
-                pricing = self.config.returns.pricing_policy
-                if pricing == ReturnsPricingPolicy.ARBITRARY_OVERRIDE:
-                    unit_price = self.rng.integer(
-                        product.current_price_cents // 2,
-                        product.current_price_cents * 2,
-                    )
-                else:
-                    unit_price = product.current_price_cents
-
-                line_items.append(LineItem(
-                    line_number=i + 1,
-                    sku=product.sku,
-                    quantity=quantity,
-                    unit_price_cents=unit_price,
-                    discount_cents=0,
-                    promotion_codes=(),
-                ))
+                )
+                for i, orig_item in enumerate(original_items[idx] for idx in indices)
+            )
+
+        # No original reference or aggregated - generate arbitrary return
+        active_products = state.get_active_products()
+        if not active_products:
+            return ()
+
+        rng_choice = self.rng.choice
+        is_override = pricing == ReturnsPricingPolicy.ARBITRARY_OVERRIDE
+
+        num_items = rng_integer(1, 3)
+        return tuple(
+            LineItem(
+                line_number=i + 1,
+                sku=product.sku,
+                quantity=rng_integer(1, 3),
+                unit_price_cents=(
+                    rng_integer(product.current_price_cents // 2, product.current_price_cents * 2)
+                    if is_override
+                    else product.current_price_cents
+                ),
+                discount_cents=0,
+                promotion_codes=(),
+            )
+            for i, product in enumerate(rng_choice(active_products) for _ in range(num_items))
+        )
+
+    def _original_price(self, orig_item: LineItem, product: ProductState | None) -> int:
+        """Refund at the price originally paid."""
+        return orig_item.unit_price_cents
+
+    def _current_price(self, orig_item: LineItem, product: ProductState | None) -> int:
+        """Refund at the product's current price, if it still exists."""
+        return product.current_price_cents if product else orig_item.unit_price_cents
 
-        return line_items
+    def _override_price(self, orig_item: LineItem, product: ProductState | None) -> int:
+        """Refund at an arbitrary price up to the original."""
+        return self.rng.integer(orig_item.unit_price_cents // 2, orig_item.unit_price_cents)
@@ -1,5 +1,6 @@
 """Sale event emitter."""
 
+from collections.abc import Iterator
 from datetime import timedelta
 
 from dim_mod_sim.core.random import SeededRandom
@@ -11,13 +12,34 @@ from dim_mod_sim.events.models import (
     Payment,
     SaleEvent,
 )
-from dim_mod_sim.events.state import WorldState
+from dim_mod_sim.events.state import ProductState, WorldState
 from dim_mod_sim.shop.config import ShopConfiguration
 from dim_mod_sim.shop.options import PromotionsPerLineItem, TransactionGrain
 
 
-PAYMENT_METHODS = ["cash", "credit_card", "debit_card", "gift_card", "mobile_pay"]
-RETURN_REASONS = ["defective", "wrong_item", "changed_mind", "not_as_described", "duplicate"]
+PAYMENT_METHODS = ("cash", "credit_card", "debit_card", "gift_card", "mobile_pay")
+RETURN_REASONS = ("defective", "wrong_item", "changed_mind", "not_as_described", "duplicate")
+
+
+def _split_payment(total_cents: int, fractions: list[float]) -> list[int]:
+    """Split a total into one payment per fraction plus a final remainder.
+
+    Each split takes between 100 cents and all but 100 cents of what is
+    left, scaled by its fraction in [0, 1). Splitting stops early once less
+    than 200 cents remain, so small totals yield fewer payments.
+    """
+    amounts: list[int] = []
+    remaining = total_cents
+
+    for fraction in fractions:
+        if remaining < 200:
+            break
+        amount = 100 + int(fraction * (remaining - 199))
+        amounts.append(amount)
+        remaining -= amount
+
+    amounts.append(remaining)
+    return amounts
 
 
 class SaleEventEmitter(EventEmitter):
@@ -28,17 +50,15 @@ class SaleEventEmitter(EventEmitter):
 
     def should_emit(self, state: WorldState) -> bool:
         """Sales can happen anytime during business hours."""
-        hour = state.current_timestamp.hour
+        hour = state.current_hour
         return 8 <= hour <= 22  # Store hours
 
-    def emit(self, state: WorldState) -> list[BaseEvent]:
+    def emit(self, state: WorldState) -> Iterator[BaseEvent]:
         """Generate a sale event."""
-        events: list[BaseEvent] = []
-
         # Select store and get employee/register
         open_stores = state.get_open_stores()
         if not open_stores:
-            return events
+            return
 
         store = self.rng.choice(open_stores)
         register = self.rng.choice(store.registers)
@@ -48,15 +68,11 @@ class SaleEventEmitter(EventEmitter):
         customer_id = state.get_or_create_customer()
 
         # Generate line items
-        line_items = self._generate_line_items(state, store.store_id)
+        line_items, total_cents = self._generate_line_items(state, store.store_id)
         if not line_items:
-            return events
+            return
 
         # Generate payments
-        total_cents = sum(
-            (li.unit_price_cents * li.quantity) - li.discount_cents
-            for li in line_items
-        )
         payments = self._generate_payments(total_cents)
 
         # Determine if aggregated (receipt-level grain)
@@ -91,132 +107,148 @@ class SaleEventEmitter(EventEmitter):
             register_id=register,
             employee_id=employee,
             customer_id=customer_id,
-            line_items=tuple(line_items),
-            payments=tuple(payments),
+            line_items=line_items,
+            payments=payments,
             is_aggregated=is_aggregated,
         )
 
         # Store in history for potential returns
-        state.transaction_history[transaction_id] = sale_event
+        state.record_transaction(sale_event)
 
         # Update inventory
         if not is_aggregated:
             for li in line_items:
                 state.update_inventory(store.store_id, li.sku, -li.quantity)
 
-        events.append(sale_event)
-        return events
+        yield sale_event
 
     def _generate_line_items(
         self, state: WorldState, store_id: str
-    ) -> list[LineItem]:
-        """Generate line items for a transaction."""
-        line_items: list[LineItem] = []
+    ) -> tuple[tuple[LineItem, ...], int]:
+        """Generate line items for a transaction.
+
+        Returns:
+            Tuple of (line_items, total_cents)
+        """
         active_products = state.get_active_products()
 
         if not active_products:
-            return line_items
+            return (), 0
 
         # Decide number of items (1-10)
         num_items = self.rng.integer(1, 10)
 
-        for i in range(num_items):
-            product = self.rng.choice(active_products)
-
-            # Handle bundles
-            bundle_parent = None
-            if product.bundle_components and self.rng.boolean(0.8):
-                # Emit bundle as parent + components
-                bundle_parent = i + 1
-
-            quantity = self.rng.integer(1, 5)
-
-            # Apply promotions
-            promo_codes: list[str] = []
-            discount_cents = 0
-
-            applicable_promos = [
-                p for p in state.promotions.values()
-                if not p.is_basket_level
-                and (p.applicable_skus is None or product.sku in p.applicable_skus)
-            ]
-
-            if applicable_promos:
-                if self.config.promotions.promotions_per_line_item == PromotionsPerLineItem.MANY:
-                    # Can have multiple promotions
-                    num_promos = self.rng.integer(0, min(3, len(applicable_promos)))
-                    selected = self.rng.sample(applicable_promos, num_promos) if num_promos > 0 else []
-                else:
-                    # At most one promotion
-                    selected = [self.rng.choice(applicable_promos)] if self.rng.boolean(0.3) else []
-
-                for promo in selected:
-                    promo_codes.append(promo.promotion_code)
-                    if promo.discount_type == "percent":
-                        discount_cents += (product.current_price_cents * promo.discount_value // 100)
-                    elif promo.discount_type == "fixed":
-                        discount_cents += promo.discount_value
-
-            # Manual override
-            if self.config.transactions.manual_overrides and self.rng.boolean(0.05):
-                # Apply arbitrary discount
-                discount_cents = self.rng.integer(0, product.current_price_cents // 2)
-
-            line_items.append(LineItem(
+        many_promos = (
+            self.config.promotions.promotions_per_line_item == PromotionsPerLineItem.MANY
+        )
+        manual_overrides = self.config.transactions.manual_overrides
+
+        # Draw the per-item values for the whole transaction up front
+        products = self.rng.choices(active_products, num_items)
+        quantities = self.rng.integers(1, 5, num_items)
+        bundle_flags = self.rng.booleans(0.8, num_items)
+        override_flags = (
+            self.rng.booleans(0.05, num_items) if manual_overrides else [False] * num_items
+        )
+        discounts = [
+            self._price_line_item(state, product, many_promos, override)
+            for product, override in zip(products, override_flags)
+        ]
+
+        # Total from the drawn values rather than a pass over the built LineItems
+        total_cents = sum(
+            product.current_price_cents * quantity - discount_cents
+            for product, quantity, (discount_cents, _) in zip(products, quantities, discounts)
+        )
+
+        line_items = tuple(
+            LineItem(
                 line_number=i + 1,
                 sku=product.sku,
                 quantity=quantity,
                 unit_price_cents=product.current_price_cents,
                 discount_cents=discount_cents,
-                promotion_codes=tuple(promo_codes),
-                bundle_parent_line=bundle_parent,
-            ))
-
-        return line_items
+                promotion_codes=promo_codes,
+                # Bundles are emitted as parent + components
+                bundle_parent_line=i + 1 if product.bundle_components and bundle_flag else None,
+            )
+            for i, (product, quantity, bundle_flag, (discount_cents, promo_codes)) in enumerate(
+                zip(products, quantities, bundle_flags, discounts)
+            )
+        )
+        return line_items, total_cents
+
+    def _price_line_item(
+        self,
+        state: WorldState,
+        product: ProductState,
+        many_promos: bool,
+        manual_override: bool,
+    ) -> tuple[int, tuple[str, ...]]:
+        """Apply promotions and any manual override to a line item.
+
+        Returns:
+            Tuple of (discount_cents, promotion_codes)
+        """
+        discount_cents = 0
+        promo_codes: tuple[str, ...] = ()
+
+        applicable_promos = state.get_line_item_promotions(product.sku)
+
+        if applicable_promos:
+            if many_promos:
+                # Can have multiple promotions
+                num_promos = self.rng.integer(0, min(3, len(applicable_promos)))
+                selected = self.rng.sample(applicable_promos, num_promos) if num_promos > 0 else []
+            else:
+                # At most one promotion
+                selected = [self.rng.choice(applicable_promos)] if self.rng.boolean(0.3) else []
+
+            promo_codes = tuple(promo.promotion_code for promo in selected)
+            for promo in selected:
+                if promo.discount_type == "percent":
+                    discount_cents += (product.current_price_cents * promo.discount_value // 100)
+                elif promo.discount_type == "fixed":
+                    discount_cents += promo.discount_value
+
+        if manual_override:
+            # Apply arbitrary discount
+            discount_cents = self.rng.integer(0, product.current_price_cents // 2)
+
+        return discount_cents, promo_codes
 
     def _aggregate_line_items(
-        self, line_items: list[LineItem], total_cents: int
-    ) -> list[LineItem]:
+        self, line_items: tuple[LineItem, ...], total_cents: int
+    ) -> tuple[LineItem, ...]:
         """Aggregate line items for receipt-level grain."""
         # Create a single aggregated line item
-        return [LineItem(
+        return (LineItem(
             line_number=1,
             sku="AGGREGATE",
             quantity=1,
             unit_price_cents=total_cents,
             discount_cents=0,
             promotion_codes=(),
-        )]
+        ),)
 
-    def _generate_payments(self, total_cents: int) -> list[Payment]:
+    def _generate_payments(self, total_cents: int) -> tuple[Payment, ...]:
         """Generate payment(s) for a transaction."""
-        payments: list[Payment] = []
-
         if self.config.transactions.multiple_payments and self.rng.boolean(0.2):
             # Split payment
             num_payments = self.rng.integer(2, 3)
-            remaining = total_cents
-
-            for i in range(num_payments - 1):
-                amount = self.rng.integer(100, remaining - 100)
-                payments.append(Payment(
-                    payment_method=self.rng.choice(PAYMENT_METHODS),
-                    amount_cents=amount,
-                    reference_number=f"PAY-{self.rng.integer(100000, 999999)}",
-                ))
-                remaining -= amount
-
-            payments.append(Payment(
-                payment_method=self.rng.choice(PAYMENT_METHODS),
-                amount_cents=remaining,
-                reference_number=f"PAY-{self.rng.integer(100000, 999999)}",
-            ))
+            amounts = _split_payment(total_cents, self.rng.floats(num_payments - 1))
         else:
             # Single payment
-            payments.append(Payment(
-                payment_method=self.rng.choice(PAYMENT_METHODS),
-                amount_cents=total_cents,
-                reference_number=f"PAY-{self.rng.integer(100000, 999999)}",
-            ))
-
-        return payments
+            amounts = [total_cents]
+
+        methods = self.rng.choices(PAYMENT_METHODS, len(amounts))
+        references = self.rng.integers(100000, 999999, len(amounts))
+
+        return tuple(
+            Payment(
+                payment_method=method,
+                amount_cents=amount,
+                reference_number="PAY-" + str(reference),
+            )
+            for method, amount, reference in zip(methods, amounts, references)
+        )
@@ -1,5 +1,6 @@
 """Void and correction event emitters."""
 
+from collections.abc import Callable, Iterator
 from datetime import timedelta
 from typing import Any
 
@@ -15,31 +16,31 @@ from dim_mod_sim.events.state import WorldState
 from dim_mod_sim.shop.config import ShopConfiguration
 
 
-VOID_REASONS = [
+VOID_REASONS = (
     "customer_request",
     "duplicate_entry",
     "cashier_error",
     "fraud_suspected",
     "test_transaction",
     "system_error",
-]
+)
 
-CORRECTION_REASONS = [
+CORRECTION_REASONS = (
     "price_correction",
     "quantity_correction",
     "customer_id_correction",
     "promotion_applied_late",
     "tax_adjustment",
     "data_entry_error",
-]
+)
 
-CORRECTABLE_FIELDS = [
+CORRECTABLE_FIELDS = (
     "customer_id",
     "employee_id",
     "line_item_quantity",
     "line_item_price",
     "promotion_code",
-]
+)
 
 
 class VoidEventEmitter(EventEmitter):
@@ -60,33 +61,27 @@ class VoidEventEmitter(EventEmitter):
         # Voids are relatively rare
         return self.rng.boolean(0.03)
 
-    def emit(self, state: WorldState) -> list[BaseEvent]:
+    def emit(self, state: WorldState) -> Iterator[BaseEvent]:
         """Generate a void event."""
-        events: list[BaseEvent] = []
-
-        # Find voidable transactions (not already voided)
-        voidable = [
-            txn_id for txn_id in state.transaction_history
-            if txn_id not in state.voided_events
-        ]
-
-        if not voidable:
-            return events
+        # Voidable transactions are those not already voided
+        if not state.non_voided_txn_ids:
+            return
 
         # Select transaction to void
-        txn_id = self.rng.choice(voidable)
+        txn_id = self.rng.choice(state.non_voided_txn_ids)
         original = state.transaction_history[txn_id]
 
         # Get authorizing manager
         store = state.stores.get(original.store_id)
         authorized_by = self.rng.choice(store.employees) if store else "MGR-UNKNOWN"
 
+        event_id, void_id = state.generate_tagged_id("VOID")
         void_event = VoidEvent(
-            event_id=state.generate_event_id(),
+            event_id=event_id,
             event_type=EventType.VOID,
             event_timestamp=state.current_timestamp,
             business_effective_date=state.current_business_date,
-            void_id=f"VOID-{state._event_sequence:08d}",
+            void_id=void_id,
             original_event_id=original.event_id,
             original_event_type=EventType.SALE,
             void_reason=self.rng.choice(VOID_REASONS),
@@ -94,15 +89,14 @@ class VoidEventEmitter(EventEmitter):
         )
 
         # Mark as voided
-        state.voided_events.add(txn_id)
+        state.mark_voided(txn_id)
 
         # Restore inventory
         if not original.is_aggregated:
             for li in original.line_items:
                 state.update_inventory(original.store_id, li.sku, li.quantity)
 
-        events.append(void_event)
-        return events
+        yield void_event
 
 
 class CorrectionEventEmitter(EventEmitter):
@@ -110,6 +104,17 @@ class CorrectionEventEmitter(EventEmitter):
 
     def __init__(self, config: ShopConfiguration, rng: SeededRandom) -> None:
         super().__init__(config, rng)
+        # Builds the (field, new_value) correction for each correctable field,
+        # or None when the original event has nothing to correct there
+        self._correction_handlers: dict[
+            str, Callable[[WorldState, "SaleEvent"], tuple[str, Any] | None]
+        ] = {
+            "customer_id": self._correct_customer,
+            "employee_id": self._correct_employee,
+            "line_item_quantity": self._correct_line_item_quantity,
+            "line_item_price": self._correct_line_item_price,
+            "promotion_code": self._correct_promotion_code,
+        }
 
     def should_emit(self, state: WorldState) -> bool:
         """Check if correction events should be emitted."""
@@ -123,21 +128,14 @@ class CorrectionEventEmitter(EventEmitter):
         # Corrections are relatively rare
         return self.rng.boolean(0.02)
 
-    def emit(self, state: WorldState) -> list[BaseEvent]:
+    def emit(self, state: WorldState) -> Iterator[BaseEvent]:
         """Generate a correction event."""
-        events: list[BaseEvent] = []
-
-        # Find correctable transactions (not voided)
-        correctable = [
-            txn_id for txn_id in state.transaction_history
-            if txn_id not in state.voided_events
-        ]
-
-        if not correctable:
-            return events
+        # Correctable transactions are those not voided
+        if not state.non_voided_txn_ids:
+            return
 
         # Select transaction to correct
-        txn_id = self.rng.choice(correctable)
+        txn_id = self.rng.choice(state.non_voided_txn_ids)
         original = state.transaction_history[txn_id]
 
         # Generate corrections
@@ -151,69 +149,73 @@ class CorrectionEventEmitter(EventEmitter):
         if self.rng.boolean(0.3):
             backdated_date = backdated_date + timedelta(days=self.rng.integer(0, 3))
 
+        event_id, correction_id = state.generate_tagged_id("CORR")
         correction_event = CorrectionEvent(
-            event_id=state.generate_event_id(),
+            event_id=event_id,
             event_type=EventType.CORRECTION,
             event_timestamp=state.current_timestamp,
             business_effective_date=backdated_date,
-            correction_id=f"CORR-{state._event_sequence:08d}",
+            correction_id=correction_id,
             original_event_id=original.event_id,
-            field_corrections=tuple(field_corrections),
+            field_corrections=field_corrections,
             correction_reason=self.rng.choice(CORRECTION_REASONS),
         )
 
-        events.append(correction_event)
-        return events
+        yield correction_event
 
     def _generate_corrections(
         self, state: WorldState, original: "SaleEvent"
-    ) -> list[tuple[str, Any]]:
+    ) -> tuple[tuple[str, Any], ...]:
         """Generate field corrections for an event."""
-        corrections: list[tuple[str, Any]] = []
-
         # Pick 1-2 fields to correct
         num_corrections = self.rng.integer(1, 2)
         fields_to_correct = self.rng.sample(CORRECTABLE_FIELDS, num_corrections)
 
-        for field in fields_to_correct:
-            if field == "customer_id":
-                # Change customer ID
-                new_customer = state.get_or_create_customer()
-                corrections.append(("customer_id", new_customer))
-
-            elif field == "employee_id":
-                # Change employee ID
-                store = state.stores.get(original.store_id)
-                if store and store.employees:
-                    new_employee = self.rng.choice(store.employees)
-                    corrections.append(("employee_id", new_employee))
-
-            elif field == "line_item_quantity":
-                # Correct a line item quantity
-                if original.line_items and not original.is_aggregated:
-                    li = self.rng.choice(original.line_items)
-                    new_qty = self.rng.integer(1, li.quantity + 2)
-                    corrections.append((
-                        f"line_items[{li.line_number}].quantity",
-                        new_qty,
-                    ))
-
-            elif field == "line_item_price":
-                # Correct a line item price
-                if original.line_items and not original.is_aggregated:
-                    li = self.rng.choice(original.line_items)
-                    adjustment = self.rng.integer(-500, 500)
-                    new_price = max(1, li.unit_price_cents + adjustment)
-                    corrections.append((
-                        f"line_items[{li.line_number}].unit_price_cents",
-                        new_price,
-                    ))
-
-            elif field == "promotion_code":
-                # Add a promotion that should have been applied
-                applicable_promos = list(state.promotions.keys())
-                if applicable_promos:
-                    promo = self.rng.choice(applicable_promos)
-                    corrections.append(("promotion_code_added", promo))
-
-        return corrections
+        handlers = self._correction_handlers
+        corrections = [handlers[field](state, original) for field in fields_to_correct]
+        return tuple(correction for correction in corrections if correction is not None)
+
+    def _correct_customer(
+        self, state: WorldState, original: "SaleEvent"
+    ) -> tuple[str, Any] | None:
+        """Change customer ID."""
+        return ("customer_id", state.get_or_create_customer())
+
+    def _correct_employee(
+        self, state: WorldState, original: "SaleEvent"
+    ) -> tuple[str, Any] | None:
+        """Change employee ID."""
+        store = state.stores.get(original.store_id)
+        if store and store.employees:
+            return ("employee_id", self.rng.choice(store.employees))
+        return None
+
+    def _correct_line_item_quantity(
+        self, state: WorldState, original: "SaleEvent"
+    ) -> tuple[str, Any] | None:
+        """Correct a line item quantity."""
+        if original.line_items and not original.is_aggregated:
+            li = self.rng.choice(original.line_items)
+            new_qty = self.rng.integer(1, li.quantity + 2)
+            return (f"line_items[{li.line_number}].quantity", new_qty)
+        return None
+
+    def _correct_line_item_price(
+        self, state: WorldState, original: "SaleEvent"
+    ) -> tuple[str, Any] | None:
+        """Correct a line item price."""
+        if original.line_items and not original.is_aggregated:
+            li = self.rng.choice(original.line_items)
+            adjustment = self.rng.integer(-500, 500)
+            new_price = max(1, li.unit_price_cents + adjustment)
+            return (f"line_items[{li.line_number}].unit_price_cents", new_price)
+        return None
+
+    def _correct_promotion_code(
+        self, state: WorldState, original: "SaleEvent"
+    ) -> tuple[str, Any] | None:
+        """Add a promotion that should have been applied."""
+        applicable_promos = state.promo_keys
+        if applicable_promos:
+            return ("promotion_code_added", self.rng.choice(applicable_promos))
+        return None
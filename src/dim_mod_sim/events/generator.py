@@ -1,6 +1,9 @@
 """Event generator orchestrator."""
 
+import heapq
 from datetime import timedelta
+from itertools import islice
+from operator import attrgetter
 
 from dim_mod_sim.core.random import SeededRandom
 from dim_mod_sim.events.emitters.base import EventEmitter
@@ -9,10 +12,33 @@ from dim_mod_sim.events.emitters.returns import ReturnEventEmitter
 from dim_mod_sim.events.emitters.sales import SaleEventEmitter
 from dim_mod_sim.events.emitters.voids import CorrectionEventEmitter, VoidEventEmitter
 from dim_mod_sim.events.models import BaseEvent, EventLog, ProductChangeEvent, EventType
-from dim_mod_sim.events.state import WorldState, initialize_world_state
+from dim_mod_sim.events.state import CATEGORY_PATHS, WorldState, initialize_world_state
 from dim_mod_sim.shop.config import ShopConfiguration
 from dim_mod_sim.shop.options import ProductHierarchyChangeFrequency, ReturnsReferencePolicy
 
+# Simulated business day: ticks of random length until closing time
+CLOSING_HOUR = 23
+MIN_TICK_MINUTES = 5
+MAX_TICK_MINUTES = 30
+
+# Daily chance of a product change event, by configured frequency
+PRODUCT_CHANGE_PROBABILITY = {
+    ProductHierarchyChangeFrequency.NONE: 0.0,
+    ProductHierarchyChangeFrequency.OCCASIONAL: 0.1,
+    ProductHierarchyChangeFrequency.FREQUENT: 0.3,
+}
+
+PRODUCT_CHANGE_TYPES = ("hierarchy", "price")
+
+# Category hierarchies a product can be moved into (all in PRODUCT_CATEGORIES)
+NEW_CATEGORIES = (
+    ("Grocery", "Dairy"),
+    ("Grocery", "Bakery"),
+    ("Electronics", "Audio"),
+    ("Clothing", "Men"),
+    ("Home", "Kitchen"),
+)
+
 
 class EventGenerator:
     """Orchestrates event generation across all emitters."""
@@ -23,6 +49,8 @@ class EventGenerator:
         self.rng = SeededRandom(self.seed)
         self.state = initialize_world_state(config, self.rng.fork("world"))
         self.emitters = self._create_emitters()
+        # (should_emit, emit) bound once so the tick loop skips attribute lookups
+        self._dispatch = tuple((e.should_emit, e.emit) for e in self.emitters)
 
     def _create_emitters(self) -> list[EventEmitter]:
         """Create emitters based on shop configuration."""
@@ -70,22 +98,40 @@ class EventGenerator:
         Returns:
             EventLog containing all generated events
         """
-        events: list[BaseEvent] = []
+        # Each stream is already in timestamp order, since emitters stamp
+        # events with the monotonically advancing simulation clock
+        streams: list[list[BaseEvent]] = []
+        total = 0
         days_simulated = 0
 
-        while len(events) < num_events and days_simulated < simulation_days:
+        # Decide up front which days end with a product change
+        change_probability = PRODUCT_CHANGE_PROBABILITY[
+            self.config.products.hierarchy_change_frequency
+        ]
+        if change_probability:
+            change_days = self.rng.booleans(change_probability, simulation_days)
+        else:
+            change_days = [False] * simulation_days
+
+        while total < num_events and days_simulated < simulation_days:
             # Run through a business day
-            events.extend(self._simulate_day())
-            days_simulated += 1
+            day_events = self._simulate_day()
+            streams.append(day_events)
+            total += len(day_events)
 
             # Emit product changes if configured
-            if self.config.products.hierarchy_change_frequency != ProductHierarchyChangeFrequency.NONE:
-                events.extend(self._maybe_emit_product_changes())
+            if change_days[days_simulated]:
+                changes = self._emit_product_change()
+                streams.append(changes)
+                total += len(changes)
+
+            days_simulated += 1
 
-        # Sort by timestamp and trim to requested count
-        events.sort(key=lambda e: e.event_timestamp)
-        if len(events) > num_events:
-            events = events[:num_events]
+        # Merge the sorted streams by timestamp and trim to requested count
+        events = list(islice(
+            heapq.merge(*streams, key=attrgetter("event_timestamp")),
+            num_events,
+        ))
 
         return EventLog(
             shop_config_seed=self.config.seed,
@@ -95,45 +141,48 @@ class EventGenerator:
     def _simulate_day(self) -> list[BaseEvent]:
         """Simulate a single business day."""
         events: list[BaseEvent] = []
+        events_extend = events.extend
+        state = self.state
+        dispatch = self._dispatch
 
         # Simulate from opening to closing
-        business_date = self.state.current_business_date
-
-        while self.state.current_business_date == business_date:
-            # Each tick represents some random minutes
-            tick_minutes = self.rng.integer(5, 30)
-
+        for tick_minutes in self._day_ticks():
             # Run each emitter
-            for emitter in self.emitters:
-                if emitter.should_emit(self.state):
-                    new_events = emitter.emit(self.state)
-                    events.extend(new_events)
+            for should_emit, emit in dispatch:
+                if should_emit(state):
+                    events_extend(emit(state))
 
             # Advance time
-            self.state.advance_time(tick_minutes)
+            state.advance_time(tick_minutes)
 
-            # Check if day should end (past closing time)
-            if self.state.current_timestamp.hour >= 23:
-                self.state.advance_business_date()
+        state.advance_business_date()
 
         return events
 
-    def _maybe_emit_product_changes(self) -> list[BaseEvent]:
-        """Possibly emit product hierarchy change events."""
-        events: list[BaseEvent] = []
-
-        freq = self.config.products.hierarchy_change_frequency
-        if freq == ProductHierarchyChangeFrequency.NONE:
-            return events
+    def _day_ticks(self) -> list[int]:
+        """Draw the tick lengths, in minutes, for the rest of the business day.
 
-        # Determine probability based on frequency
-        if freq == ProductHierarchyChangeFrequency.OCCASIONAL:
-            probability = 0.1
-        else:  # FREQUENT
-            probability = 0.3
+        The day ends on the first tick that reaches closing time. Each batch
+        only draws ticks that are certain to be needed, so the random stream
+        is the same as drawing one tick at a time.
+        """
+        remaining = CLOSING_HOUR * 60 - self.state.minute_of_day
+        ticks: list[int] = []
+
+        while True:
+            batch = self.rng.integers(
+                MIN_TICK_MINUTES,
+                MAX_TICK_MINUTES,
+                max(1, -(-remaining // MAX_TICK_MINUTES)),
+            )
+            ticks.extend(batch)
+            remaining -= sum(batch)
+            if remaining <= 0:
+                return ticks
 
-        if not self.rng.boolean(probability):
-            return events
+    def _emit_product_change(self) -> list[BaseEvent]:
+        """Emit a product hierarchy or price change event."""
+        events: list[BaseEvent] = []
 
         # Select a product to change
         products = list(self.state.products.values())
@@ -143,28 +192,22 @@ class EventGenerator:
         product = self.rng.choice(products)
 
         # Change hierarchy or price
-        change_type = self.rng.choice(["hierarchy", "price"])
+        change_type = self.rng.choice(PRODUCT_CHANGE_TYPES)
 
         if change_type == "hierarchy":
             # Change category
-            old_hierarchy = " > ".join(product.category_hierarchy)
-            new_categories = [
-                ["Grocery", "Dairy"],
-                ["Grocery", "Bakery"],
-                ["Electronics", "Audio"],
-                ["Clothing", "Men"],
-                ["Home", "Kitchen"],
-            ]
-            new_hierarchy = self.rng.choice(new_categories)
+            old_hierarchy = CATEGORY_PATHS[product.category_hierarchy]
+            new_hierarchy = self.rng.choice(NEW_CATEGORIES)
             product.category_hierarchy = new_hierarchy
-            new_value = " > ".join(new_hierarchy)
+            new_value = CATEGORY_PATHS[new_hierarchy]
 
+            event_id, change_id = self.state.generate_tagged_id("PCHG")
             events.append(ProductChangeEvent(
-                event_id=self.state.generate_event_id(),
+                event_id=event_id,
                 event_type=EventType.PRODUCT_CHANGE,
                 event_timestamp=self.state.current_timestamp,
                 business_effective_date=self.state.current_business_date,
-                change_id=f"PCHG-{self.state._event_sequence:08d}",
+                change_id=change_id,
                 sku=product.sku,
                 change_type="hierarchy",
                 old_value=old_hierarchy,
@@ -176,12 +219,13 @@ class EventGenerator:
             adjustment = self.rng.integer(-1000, 1000)
             product.current_price_cents = max(100, product.current_price_cents + adjustment)
 
+            event_id, change_id = self.state.generate_tagged_id("PCHG")
             events.append(ProductChangeEvent(
-                event_id=self.state.generate_event_id(),
+                event_id=event_id,
                 event_type=EventType.PRODUCT_CHANGE,
                 event_timestamp=self.state.current_timestamp,
                 business_effective_date=self.state.current_business_date,
-                change_id=f"PCHG-{self.state._event_sequence:08d}",
+                change_id=change_id,
                 sku=product.sku,
                 change_type="price",
                 old_value=old_price,
@@ -1,9 +1,10 @@
 """Event data models."""
 
+import json
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from enum import Enum
-from typing import Any
+from typing import Any, TextIO
 
 
 class EventType(str, Enum):
@@ -19,7 +20,12 @@ class EventType(str, Enum):
     STORE_CHANGE = "store_change"
 
 
-@dataclass(frozen=True)
+# Serialized form of each event type; a dict lookup is much cheaper than the
+# Enum .value descriptor on the per-event serialization path
+_EVENT_TYPE_VALUES: dict[EventType, str] = {t: t.value for t in EventType}
+
+
+@dataclass(frozen=True, slots=True)
 class LineItem:
     """A line item within a transaction."""
 
@@ -33,18 +39,23 @@ class LineItem:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return {
-            "line_number": self.line_number,
-            "sku": self.sku,
-            "quantity": self.quantity,
-            "unit_price_cents": self.unit_price_cents,
-            "discount_cents": self.discount_cents,
-            "promotion_codes": list(self.promotion_codes),
-            "bundle_parent_line": self.bundle_parent_line,
-        }
+        return _line_item_dict(self)
+
+
+def _line_item_dict(li: LineItem) -> dict[str, Any]:
+    """Serialize a LineItem; a plain function so event to_dict can skip the method lookup."""
+    return {
+        "line_number": li.line_number,
+        "sku": li.sku,
+        "quantity": li.quantity,
+        "unit_price_cents": li.unit_price_cents,
+        "discount_cents": li.discount_cents,
+        "promotion_codes": list(li.promotion_codes),
+        "bundle_parent_line": li.bundle_parent_line,
+    }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Payment:
     """A payment within a transaction."""
 
@@ -61,7 +72,9 @@ class Payment:
         }
 
 
-@dataclass(frozen=True)
+# Subclass to_dict methods repeat the base fields in a single dict literal
+# rather than extending BaseEvent.to_dict(); serialization is the hot path.
+@dataclass(frozen=True, slots=True)
 class BaseEvent:
     """Base class for all events with common fields."""
 
@@ -74,13 +87,13 @@ class BaseEvent:
         """Convert to dictionary for JSON serialization."""
         return {
             "event_id": self.event_id,
-            "event_type": self.event_type.value,
+            "event_type": _EVENT_TYPE_VALUES[self.event_type],
             "event_timestamp": self.event_timestamp.isoformat(),
             "business_effective_date": self.business_effective_date.isoformat(),
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SaleEvent(BaseEvent):
     """A sale transaction event."""
 
@@ -99,21 +112,32 @@ class SaleEvent(BaseEvent):
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        base = super().to_dict()
-        base.update({
+        # Built as one literal, with line items and payments inlined, since
+        # sales dominate serialization; keys match the base + update layout
+        return {
+            "event_id": self.event_id,
+            "event_type": _EVENT_TYPE_VALUES[self.event_type],
+            "event_timestamp": self.event_timestamp.isoformat(),
+            "business_effective_date": self.business_effective_date.isoformat(),
             "transaction_id": self.transaction_id,
             "store_id": self.store_id,
             "register_id": self.register_id,
             "employee_id": self.employee_id,
             "customer_id": self.customer_id,
-            "line_items": [li.to_dict() for li in self.line_items],
-            "payments": [p.to_dict() for p in self.payments],
+            "line_items": [_line_item_dict(li) for li in self.line_items],
+            "payments": [
+                {
+                    "payment_method": p.payment_method,
+                    "amount_cents": p.amount_cents,
+                    "reference_number": p.reference_number,
+                }
+                for p in self.payments
+            ],
             "is_aggregated": self.is_aggregated,
-        })
-        return base
+        }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReturnEvent(BaseEvent):
     """A return transaction event."""
 
@@ -132,22 +156,24 @@ class ReturnEvent(BaseEvent):
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        base = super().to_dict()
-        base.update({
+        return {
+            "event_id": self.event_id,
+            "event_type": _EVENT_TYPE_VALUES[self.event_type],
+            "event_timestamp": self.event_timestamp.isoformat(),
+            "business_effective_date": self.business_effective_date.isoformat(),
             "return_id": self.return_id,
             "store_id": self.store_id,
             "register_id": self.register_id,
             "employee_id": self.employee_id,
             "customer_id": self.customer_id,
             "original_transaction_id": self.original_transaction_id,
-            "line_items": [li.to_dict() for li in self.line_items],
+            "line_items": [_line_item_dict(li) for li in self.line_items],
             "return_reason_code": self.return_reason_code,
             "price_determination": self.price_determination,
-        })
-        return base
+        }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VoidEvent(BaseEvent):
     """A void/cancellation event."""
 
@@ -162,18 +188,20 @@ class VoidEvent(BaseEvent):
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        base = super().to_dict()
-        base.update({
+        return {
+            "event_id": self.event_id,
+            "event_type": _EVENT_TYPE_VALUES[self.event_type],
+            "event_timestamp": self.event_timestamp.isoformat(),
+            "business_effective_date": self.business_effective_date.isoformat(),
             "void_id": self.void_id,
             "original_event_id": self.original_event_id,
-            "original_event_type": self.original_event_type.value,
+            "original_event_type": _EVENT_TYPE_VALUES[self.original_event_type],
             "void_reason": self.void_reason,
             "authorized_by": self.authorized_by,
-        })
-        return base
+        }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CorrectionEvent(BaseEvent):
     """A correction to a prior event."""
 
@@ -187,17 +215,19 @@ class CorrectionEvent(BaseEvent):
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        base = super().to_dict()
-        base.update({
+        return {
+            "event_id": self.event_id,
+            "event_type": _EVENT_TYPE_VALUES[self.event_type],
+            "event_timestamp": self.event_timestamp.isoformat(),
+            "business_effective_date": self.business_effective_date.isoformat(),
             "correction_id": self.correction_id,
             "original_event_id": self.original_event_id,
             "field_corrections": {k: v for k, v in self.field_corrections},
             "correction_reason": self.correction_reason,
-        })
-        return base
+        }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InventoryAdjustmentEvent(BaseEvent):
     """A transactional inventory change."""
 
@@ -213,19 +243,21 @@ class InventoryAdjustmentEvent(BaseEvent):
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        base = super().to_dict()
-        base.update({
+        return {
+            "event_id": self.event_id,
+            "event_type": _EVENT_TYPE_VALUES[self.event_type],
+            "event_timestamp": self.event_timestamp.isoformat(),
+            "business_effective_date": self.business_effective_date.isoformat(),
             "adjustment_id": self.adjustment_id,
             "store_id": self.store_id,
             "sku": self.sku,
             "quantity_change": self.quantity_change,
             "reason_code": self.reason_code,
             "reference_event_id": self.reference_event_id,
-        })
-        return base
+        }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InventorySnapshotEvent(BaseEvent):
     """A periodic inventory snapshot."""
 
@@ -240,18 +272,20 @@ class InventorySnapshotEvent(BaseEvent):
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        base = super().to_dict()
-        base.update({
+        return {
+            "event_id": self.event_id,
+            "event_type": _EVENT_TYPE_VALUES[self.event_type],
+            "event_timestamp": self.event_timestamp.isoformat(),
+            "business_effective_date": self.business_effective_date.isoformat(),
             "snapshot_id": self.snapshot_id,
             "store_id": self.store_id,
             "sku": self.sku,
             "quantity_on_hand": self.quantity_on_hand,
             "snapshot_type": self.snapshot_type,
-        })
-        return base
+        }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProductChangeEvent(BaseEvent):
     """A product hierarchy or attribute change."""
 
@@ -266,18 +300,20 @@ class ProductChangeEvent(BaseEvent):
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        base = super().to_dict()
-        base.update({
+        return {
+            "event_id": self.event_id,
+            "event_type": _EVENT_TYPE_VALUES[self.event_type],
+            "event_timestamp": self.event_timestamp.isoformat(),
+            "business_effective_date": self.business_effective_date.isoformat(),
             "change_id": self.change_id,
             "sku": self.sku,
             "change_type": self.change_type,
             "old_value": self.old_value,
             "new_value": self.new_value,
-        })
-        return base
+        }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StoreChangeEvent(BaseEvent):
     """A store lifecycle change."""
 
@@ -291,14 +327,16 @@ class StoreChangeEvent(BaseEvent):
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        base = super().to_dict()
-        base.update({
+        return {
+            "event_id": self.event_id,
+            "event_type": _EVENT_TYPE_VALUES[self.event_type],
+            "event_timestamp": self.event_timestamp.isoformat(),
+            "business_effective_date": self.business_effective_date.isoformat(),
             "change_id": self.change_id,
             "store_id": self.store_id,
             "change_type": self.change_type,
             "related_store_id": self.related_store_id,
-        })
-        return base
+        }
 
 
 @dataclass
@@ -310,12 +348,46 @@ class EventLog:
 
     def to_json_lines(self) -> str:
         """Serialize to JSON Lines format."""
-        import json
-
-        lines = []
+        dumps = json.dumps
+        return "\n".join([dumps(event.to_dict()) for event in self.events])
+
+    def write_json_lines(self, fp: TextIO) -> None:
+        """Stream events as JSON Lines to a text file object.
+
+        Writes one newline-terminated line per event without materializing
+        the whole log as a string; preferred over to_json_lines() for large
+        logs.
+        """
+        dumps = json.dumps
+        write = fp.write
+        for event in self.events:
+            write(dumps(event.to_dict()))
+            write("\n")
+
+    def write_json(self, fp: TextIO) -> None:
+        """Stream the log as indented JSON to a text file object.
+
+        The output is identical to json.dumps(self.to_dict(), indent=2), but
+        events are encoded and written one at a time instead of building the
+        full dictionary (and then the full string) in memory first.
+        """
+        dumps = json.dumps
+        write = fp.write
+        write("{\n")
+        write(f'  "shop_config_seed": {dumps(self.shop_config_seed)},\n')
+        write(f'  "event_count": {len(self.events)},\n')
+        if not self.events:
+            write('  "events": []\n}')
+            return
+
+        write('  "events": [\n')
+        separator = "    "
         for event in self.events:
-            lines.append(json.dumps(event.to_dict()))
-        return "\n".join(lines)
+            write(separator)
+            # JSON strings never contain raw newlines, so re-indenting is safe
+            write(dumps(event.to_dict(), indent=2).replace("\n", "\n    "))
+            separator = ",\n    "
+        write("\n  ]\n}")
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -1,27 +1,55 @@
 """World state for event simulation."""
 
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
+from itertools import chain
 
 from dim_mod_sim.core.random import SeededRandom
 from dim_mod_sim.shop.config import ShopConfiguration
 from dim_mod_sim.shop.options import CustomerIdReliability
 
+# Prefix of every event_id; the remainder is the zero-padded event sequence
+EVENT_ID_PREFIX = "EVT-"
 
-@dataclass
+# Minute of the day at which each business day opens (09:00)
+OPENING_MINUTE = 9 * 60
+
+DISCOUNT_TYPES = ("percent", "fixed", "bogo")
+
+# Category hierarchies products are drawn from; products share these tuples
+PRODUCT_CATEGORIES: tuple[tuple[str, ...], ...] = (
+    ("Grocery", "Dairy"),
+    ("Grocery", "Bakery"),
+    ("Grocery", "Produce"),
+    ("Electronics", "Audio"),
+    ("Electronics", "Computing"),
+    ("Clothing", "Men"),
+    ("Clothing", "Women"),
+    ("Home", "Kitchen"),
+    ("Home", "Garden"),
+)
+
+# Display path of each category hierarchy, e.g. "Grocery > Dairy"
+CATEGORY_PATHS: dict[tuple[str, ...], str] = {
+    category: " > ".join(category) for category in PRODUCT_CATEGORIES
+}
+
+
+@dataclass(slots=True)
 class ProductState:
     """State of a product in the simulation."""
 
     sku: str
     name: str
-    category_hierarchy: list[str]
+    category_hierarchy: tuple[str, ...]
     current_price_cents: int
     is_active: bool = True
     is_virtual: bool = False
     bundle_components: list[str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StoreState:
     """State of a store in the simulation."""
 
@@ -35,7 +63,7 @@ class StoreState:
     employees: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomerState:
     """State of a customer in the simulation."""
 
@@ -44,7 +72,7 @@ class CustomerState:
     is_anonymous: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class PromotionState:
     """State of a promotion in the simulation."""
 
@@ -59,16 +87,50 @@ class PromotionState:
     is_stackable: bool = False
 
 
-@dataclass
+class _GroupedIds(Sequence[str]):
+    """Read-only view concatenating per-store ID lists without copying them.
+
+    Indexing walks the groups, so it costs O(number of stores) rather than
+    O(number of IDs).
+    """
+
+    __slots__ = ("_groups",)
+
+    def __init__(self, groups: dict[str, list[str]]) -> None:
+        self._groups = groups
+
+    def __len__(self) -> int:
+        return sum(map(len, self._groups.values()))
+
+    def __iter__(self) -> Iterator[str]:
+        return chain.from_iterable(self._groups.values())
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += len(self)
+        if index >= 0:
+            for ids in self._groups.values():
+                if index < len(ids):
+                    return ids[index]
+                index -= len(ids)
+        raise IndexError("transaction index out of range")
+
+
+@dataclass(slots=True)
 class WorldState:
     """Tracks the simulated world state during event generation."""
 
     config: ShopConfiguration
     rng: SeededRandom
 
-    # Current time in simulation
-    current_timestamp: datetime = field(default_factory=lambda: datetime(2024, 1, 1, 9, 0, 0))
+    # Current time in simulation: the business day's midnight plus a minute
+    # counter, turned into a datetime only when current_timestamp is read
     current_business_date: date = field(default_factory=lambda: date(2024, 1, 1))
+    minute_of_day: int = OPENING_MINUTE
+    _day_midnight: datetime = field(default_factory=lambda: datetime(2024, 1, 1))
+    _timestamp_cache: datetime | None = None
 
     # Master data
     products: dict[str, ProductState] = field(default_factory=dict)
@@ -76,6 +138,12 @@ class WorldState:
     customers: dict[str, CustomerState] = field(default_factory=dict)
     promotions: dict[str, PromotionState] = field(default_factory=dict)
 
+    # Customer and household IDs in creation order, kept in step with
+    # customers so random picks never rebuild them
+    _customer_ids: list[str] = field(default_factory=list)
+    _household_ids: list[str] = field(default_factory=list)
+    _household_id_set: set[str] = field(default_factory=set)
+
     # Inventory tracking: store_id -> sku -> quantity
     inventory: dict[str, dict[str, int]] = field(default_factory=dict)
 
@@ -83,58 +151,189 @@ class WorldState:
     transaction_history: dict[str, "SaleEvent"] = field(default_factory=dict)
     voided_events: set[str] = field(default_factory=set)
 
+    # Non-voided transaction IDs per store, with each ID's position in its
+    # store's list. This one structure backs voids, corrections and returns;
+    # swap-and-pop keeps removal O(1), so list order is not meaningful.
+    _non_voided_by_store: dict[str, list[str]] = field(default_factory=dict)
+    _non_voided_index: dict[str, int] = field(default_factory=dict)
+
     # Event sequence for event_id generation
     _event_sequence: int = 0
     _transaction_sequence: int = 0
 
+    # Cached results of get_active_products()/get_open_stores(); None means
+    # the cache must be rebuilt
+    _active_products_cache: tuple[ProductState, ...] | None = None
+    _open_stores_cache: tuple[StoreState, ...] | None = None
+
+    # SKU -> line-item promotions applicable to it, filled lazily
+    _promos_by_sku: dict[str, tuple[PromotionState, ...]] = field(default_factory=dict)
+    _promo_keys: tuple[str, ...] = ()
+    _promo_keys_dirty: bool = True
+
+    @staticmethod
+    def format_event_id(sequence: int) -> str:
+        """Format an event sequence number as an event ID."""
+        # zfill is measurably cheaper than a width format spec
+        return EVENT_ID_PREFIX + str(sequence).zfill(8)
+
     def generate_event_id(self) -> str:
         """Generate a unique event ID."""
         self._event_sequence += 1
-        return f"EVT-{self._event_sequence:08d}"
+        return self.format_event_id(self._event_sequence)
+
+    def generate_tagged_id(self, prefix: str) -> tuple[str, str]:
+        """Generate a unique event ID plus a tag ID sharing its sequence number.
+
+        Returns:
+            Tuple of (event_id, f"{prefix}-{sequence:08d}")
+        """
+        self._event_sequence += 1
+        digits = str(self._event_sequence).zfill(8)
+        return EVENT_ID_PREFIX + digits, f"{prefix}-{digits}"
+
+    def reserve_event_ids(self, count: int) -> int:
+        """Reserve a contiguous block of event sequence numbers.
+
+        Returns the sequence number preceding the block, so the reserved
+        numbers are ``base + 1`` through ``base + count``.
+        """
+        base = self._event_sequence
+        self._event_sequence += count
+        return base
 
     def generate_transaction_id(self) -> str:
         """Generate a unique transaction ID."""
         self._transaction_sequence += 1
-        return f"TXN-{self._transaction_sequence:08d}"
+        return "TXN-" + str(self._transaction_sequence).zfill(8)
+
+    def record_transaction(self, sale_event: "SaleEvent") -> None:
+        """Add a sale to the transaction history."""
+        txn_id = sale_event.transaction_id
+        self.transaction_history[txn_id] = sale_event
+        store_ids = self._non_voided_by_store.setdefault(sale_event.store_id, [])
+        self._non_voided_index[txn_id] = len(store_ids)
+        store_ids.append(txn_id)
+
+    def mark_voided(self, txn_id: str) -> None:
+        """Mark a transaction as voided."""
+        self.voided_events.add(txn_id)
+
+        idx = self._non_voided_index.pop(txn_id, None)
+        if idx is None:
+            return
+        store_ids = self._non_voided_by_store[self.transaction_history[txn_id].store_id]
+        last = store_ids.pop()
+        if idx < len(store_ids):
+            store_ids[idx] = last
+            self._non_voided_index[last] = idx
+
+    @property
+    def non_voided_txn_ids(self) -> Sequence[str]:
+        """Live read-only view of all transaction IDs not yet voided."""
+        return _GroupedIds(self._non_voided_by_store)
+
+    @property
+    def current_timestamp(self) -> datetime:
+        """Current simulation time, built at most once per clock change."""
+        timestamp = self._timestamp_cache
+        if timestamp is None:
+            timestamp = self._day_midnight + timedelta(minutes=self.minute_of_day)
+            self._timestamp_cache = timestamp
+        return timestamp
+
+    @property
+    def current_hour(self) -> int:
+        """Hour of the current simulation time, without building a datetime."""
+        return self.minute_of_day // 60
 
     def advance_time(self, minutes: int) -> None:
         """Advance simulation time by the specified minutes."""
-        self.current_timestamp += timedelta(minutes=minutes)
+        self.minute_of_day += minutes
+        self._timestamp_cache = None
 
     def advance_business_date(self) -> None:
         """Move to next business date and reset to morning."""
         self.current_business_date += timedelta(days=1)
         # Reset time to morning of new business day
-        self.current_timestamp = datetime.combine(
-            self.current_business_date,
-            datetime.min.time().replace(hour=9),
-        )
+        self._day_midnight += timedelta(days=1)
+        self.minute_of_day = OPENING_MINUTE
+        self._timestamp_cache = None
 
-    def get_open_stores(self) -> list[StoreState]:
-        """Get all currently open stores."""
-        return [s for s in self.stores.values() if s.is_open]
+    def get_open_stores(self) -> tuple[StoreState, ...]:
+        """Get all currently open stores.
 
-    def get_active_products(self) -> list[ProductState]:
-        """Get all currently active products."""
-        return [p for p in self.products.values() if p.is_active]
+        The result is cached; call invalidate_open_stores() after adding
+        stores or changing a store's is_open flag.
+        """
+        if self._open_stores_cache is None:
+            self._open_stores_cache = tuple(
+                s for s in self.stores.values() if s.is_open
+            )
+        return self._open_stores_cache
+
+    def invalidate_open_stores(self) -> None:
+        """Drop the cached open store list after store changes."""
+        self._open_stores_cache = None
 
-    def get_returnable_transactions(self, store_id: str | None = None) -> list[str]:
+    def get_active_products(self) -> tuple[ProductState, ...]:
+        """Get all currently active products.
+
+        The result is cached; call invalidate_active_products() after adding
+        products or changing a product's is_active flag.
+        """
+        if self._active_products_cache is None:
+            self._active_products_cache = tuple(
+                p for p in self.products.values() if p.is_active
+            )
+        return self._active_products_cache
+
+    def invalidate_active_products(self) -> None:
+        """Drop the cached active product list after product changes."""
+        self._active_products_cache = None
+
+    def get_line_item_promotions(self, sku: str) -> tuple[PromotionState, ...]:
+        """Get the non-basket promotions that can apply to a SKU.
+
+        Results are cached per SKU; call invalidate_promotions() after adding,
+        removing or editing promotions.
+        """
+        promos = self._promos_by_sku.get(sku)
+        if promos is None:
+            promos = tuple(
+                p for p in self.promotions.values()
+                if not p.is_basket_level
+                and (p.applicable_skus is None or sku in p.applicable_skus)
+            )
+            self._promos_by_sku[sku] = promos
+        return promos
+
+    @property
+    def promo_keys(self) -> tuple[str, ...]:
+        """Promotion codes of all promotions, cached until promotions change."""
+        if self._promo_keys_dirty:
+            self._promo_keys = tuple(self.promotions)
+            self._promo_keys_dirty = False
+        return self._promo_keys
+
+    def invalidate_promotions(self) -> None:
+        """Drop cached promotion lookups after promotion changes."""
+        self._promos_by_sku.clear()
+        self._promo_keys_dirty = True
+
+    def get_returnable_transactions(self, store_id: str | None = None) -> Sequence[str]:
         """Get transaction IDs that can be returned.
 
+        The result is a live view of internal state, not a copy; pick from it
+        but do not modify it.
+
         Args:
             store_id: If cross-store returns disabled, filter by store
         """
-        returnable = []
-        for txn_id, event in self.transaction_history.items():
-            # Skip voided transactions
-            if txn_id in self.voided_events:
-                continue
-            # If cross-store returns disabled, must match store
-            if store_id and not self.config.stores.cross_store_returns:
-                if event.store_id != store_id:
-                    continue
-            returnable.append(txn_id)
-        return returnable
+        # If cross-store returns disabled, must match store
+        if store_id and not self.config.stores.cross_store_returns:
+            return self._non_voided_by_store.get(store_id, ())
+        return self.non_voided_txn_ids
 
     def get_or_create_customer(self) -> str | None:
         """Get a customer ID based on configuration."""
@@ -154,25 +353,28 @@ class WorldState:
 
         # Return existing customer or create new
         if self.customers and self.rng.boolean(0.7):
-            return self.rng.choice(list(self.customers.keys()))
+            return self.rng.choice(self._customer_ids)
 
         # Create new customer
         customer_id = f"CUST-{len(self.customers) + 1:06d}"
         household_id = None
         if self.config.customers.household_grouping and self.rng.boolean(0.4):
             # Join existing household or create new
-            existing_households = {
-                c.household_id for c in self.customers.values() if c.household_id
-            }
+            existing_households = self._household_ids
             if existing_households and self.rng.boolean(0.5):
-                household_id = self.rng.choice(list(existing_households))
+                household_id = self.rng.choice(existing_households)
             else:
                 household_id = f"HH-{len(existing_households) + 1:04d}"
 
+            if household_id not in self._household_id_set:
+                self._household_id_set.add(household_id)
+                self._household_ids.append(household_id)
+
         self.customers[customer_id] = CustomerState(
             customer_id=customer_id,
             household_id=household_id,
         )
+        self._customer_ids.append(customer_id)
         return customer_id
 
     def update_inventory(self, store_id: str, sku: str, quantity_change: int) -> None:
@@ -205,39 +407,37 @@ def initialize_world_state(
 
     # Generate products
     product_rng = rng.fork("products")
-    categories = [
-        ["Grocery", "Dairy"],
-        ["Grocery", "Bakery"],
-        ["Grocery", "Produce"],
-        ["Electronics", "Audio"],
-        ["Electronics", "Computing"],
-        ["Clothing", "Men"],
-        ["Clothing", "Women"],
-        ["Home", "Kitchen"],
-        ["Home", "Garden"],
-    ]
-
-    for i in range(num_products):
-        sku = f"SKU-{i + 1:05d}"
-        category = product_rng.choice(categories)
-        is_virtual = config.products.virtual_products and product_rng.boolean(0.1)
-        is_bundle = config.products.bundled_products and product_rng.boolean(0.05)
-
+    # Draw each per-product attribute for the whole catalog at once
+    skus = [f"SKU-{i + 1:05d}" for i in range(num_products)]
+    product_categories = product_rng.choices(PRODUCT_CATEGORIES, num_products)
+    virtual_flags = (
+        product_rng.booleans(0.1, num_products)
+        if config.products.virtual_products
+        else [False] * num_products
+    )
+    bundle_flags = (
+        product_rng.booleans(0.05, num_products)
+        if config.products.bundled_products
+        else [False] * num_products
+    )
+    prices = product_rng.integers(100, 10000, num_products)
+
+    for i, sku in enumerate(skus):
         bundle_components = None
-        if is_bundle and i > 2:
+        if bundle_flags[i] and i > 2:
             # Bundle 2-3 existing products
-            existing_skus = list(state.products.keys())
-            num_components = product_rng.integer(2, min(3, len(existing_skus)))
-            bundle_components = product_rng.sample(existing_skus, num_components)
+            num_components = product_rng.integer(2, min(3, i))
+            bundle_components = product_rng.sample(skus[:i], num_components)
 
         state.products[sku] = ProductState(
             sku=sku,
             name=f"Product {i + 1}",
-            category_hierarchy=category.copy(),
-            current_price_cents=product_rng.integer(100, 10000),
-            is_virtual=is_virtual,
+            category_hierarchy=product_categories[i],
+            current_price_cents=prices[i],
+            is_virtual=virtual_flags[i],
             bundle_components=bundle_components,
         )
+    state.invalidate_active_products()
 
     # Generate stores
     store_rng = rng.fork("stores")
@@ -266,13 +466,16 @@ def initialize_world_state(
             registers=["WEB-1", "WEB-2", "MOBILE-1"],
             employees=[f"EMP-ONLINE-{j + 1}" for j in range(10)],
         )
+    state.invalidate_open_stores()
 
     # Initialize inventory
     if config.inventory.tracked:
-        for store_id in state.stores:
-            state.inventory[store_id] = {}
-            for sku in state.products:
-                state.inventory[store_id][sku] = rng.integer(50, 200)
+        quantities = rng.integers(50, 200, len(state.stores) * num_products)
+        for n, store_id in enumerate(state.stores):
+            offset = n * num_products
+            state.inventory[store_id] = dict(
+                zip(skus, quantities[offset:offset + num_products])
+            )
 
     # Generate promotions
     promo_rng = rng.fork("promotions")
@@ -287,12 +490,12 @@ def initialize_world_state(
         applicable_skus = None
         if not is_basket and promo_rng.boolean(0.7):
             num_skus = promo_rng.integer(1, 10)
-            applicable_skus = promo_rng.sample(list(state.products.keys()), num_skus)
+            applicable_skus = promo_rng.sample(skus, num_skus)
 
         state.promotions[promo_code] = PromotionState(
             promotion_code=promo_code,
             promotion_name=f"Promotion {i + 1}",
-            discount_type=promo_rng.choice(["percent", "fixed", "bogo"]),
+            discount_type=promo_rng.choice(DISCOUNT_TYPES),
             discount_value=promo_rng.integer(5, 50),
             applicable_skus=applicable_skus,
             start_date=state.current_business_date,
@@ -300,5 +503,6 @@ def initialize_world_state(
             is_basket_level=is_basket,
             is_stackable=is_stackable,
         )
+    state.invalidate_promotions()
 
     return state
@@ -7,6 +7,9 @@ from dim_mod_sim.explain.scenarios import generate_all_scenarios
 from dim_mod_sim.schema.models import SchemaSubmission
 from dim_mod_sim.shop.config import ShopConfiguration
 
+# Number of distinct schemas whose analysis each SchemaAnalyzer remembers
+MAX_CACHED_RESULTS = 32
+
 
 class SchemaAnalyzer:
     """Analyzes schemas and generates diagnostic explanations.
@@ -23,9 +26,29 @@ class SchemaAnalyzer:
         self.config = config
         self.events = events
         self.evaluator = SchemaEvaluator(config, events)
+        # Schema JSON -> result; config and events are fixed per analyzer
+        self._cache: dict[str, ExplainResult] = {}
 
     def analyze(self, schema: SchemaSubmission) -> ExplainResult:
-        """Analyze a schema and generate explanation scenarios."""
+        """Analyze a schema and generate explanation scenarios.
+
+        Results are cached by schema content, so resubmitting an unchanged
+        schema returns the previous (shared) ExplainResult.
+        """
+        key = schema.model_dump_json()
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = self._analyze(schema)
+        if len(self._cache) >= MAX_CACHED_RESULTS:
+            # Evict the oldest entry
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = result
+        return result
+
+    def _analyze(self, schema: SchemaSubmission) -> ExplainResult:
+        """Run evaluation and scenario generation for a schema."""
         # First, run evaluation to understand the issues
         eval_result = self.evaluator.evaluate(schema)
 
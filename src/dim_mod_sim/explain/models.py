@@ -1,11 +1,21 @@
 """Models for the explain/diagnostic module."""
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from types import MappingProxyType
 
+# Sort rank of each scenario severity (most severe first); unknown values sort last
+SEVERITY_RANKS: Mapping[str, int] = MappingProxyType(
+    {"critical": 0, "major": 1, "moderate": 2, "minor": 3}
+)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class QueryScenario:
-    """A query scenario that demonstrates a schema problem."""
+    """A query scenario that demonstrates a schema problem.
+
+    Immutable, so the analyzer can hand out shared prototype scenarios.
+    """
 
     scenario_name: str
     business_question: str
@@ -14,11 +24,15 @@ class QueryScenario:
     actual_with_schema: str  # What the schema would produce
     why_wrong: str  # Business explanation of why it's wrong
     root_cause: str  # Technical cause in the schema
-    events_involved: list[str] = field(default_factory=list)  # Event IDs/descriptions
+    events_involved: tuple[str, ...] = ()  # Event IDs/descriptions
     severity: str = "major"  # critical, major, moderate, minor
+    severity_rank: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "severity_rank", SEVERITY_RANKS.get(self.severity, 99))
 
 
-@dataclass
+@dataclass(slots=True)
 class ExplainResult:
     """Complete explanation result showing schema problems."""
 
@@ -1,8 +1,18 @@
 """Scenario generators for explaining schema problems."""
 
+from dataclasses import dataclass, field, replace
+from functools import cached_property
+from operator import attrgetter
+
 from dim_mod_sim.evaluator.result import EvaluationResult, Severity
 from dim_mod_sim.explain.models import QueryScenario
-from dim_mod_sim.schema.models import SCDType, SchemaSubmission
+from dim_mod_sim.schema.models import (
+    BridgeTable,
+    DimensionTable,
+    FactTable,
+    SCDType,
+    SchemaSubmission,
+)
 from dim_mod_sim.shop.config import ShopConfiguration
 from dim_mod_sim.shop.options import (
     ProductHierarchyChangeFrequency,
@@ -13,77 +23,276 @@ from dim_mod_sim.shop.options import (
 )
 
 
+@dataclass
+class SchemaIndex:
+    """Lowercased table names of a schema, shared by the generators.
+
+    Each part is computed on first use, so generators whose config gates are
+    closed never walk the schema at all.
+    """
+
+    schema: SchemaSubmission
+    _fact_matches: dict[str, FactTable | None] = field(default_factory=dict)
+    _dimension_matches: dict[str, DimensionTable | None] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, schema: SchemaSubmission) -> "SchemaIndex":
+        """Create a (lazy) index over a schema's tables."""
+        return cls(schema)
+
+    @cached_property
+    def _fact_scan(self) -> tuple[list[tuple[str, FactTable]], bool, bool]:
+        """Walk the fact tables once, evaluating every per-fact check in the same pass."""
+        facts: list[tuple[str, FactTable]] = []
+        has_mixed_grain_fact = False
+        has_dual_dates = False
+        for ft in self.schema.fact_tables:
+            facts.append((ft.name.lower(), ft))
+
+            grain_description = ft.grain_description.lower()
+            if "mixed" in grain_description or "or" in grain_description:
+                has_mixed_grain_fact = True
+
+            # Lowercased grain column and dimension key names, space-joined
+            cols = " ".join(
+                [gc.name for gc in ft.grain_columns] + ft.dimension_keys
+            ).lower()
+            if ("event" in cols or "record" in cols) and "business" in cols:
+                has_dual_dates = True
+
+        return facts, has_mixed_grain_fact, has_dual_dates
+
+    @property
+    def facts(self) -> list[tuple[str, FactTable]]:
+        """Fact tables paired with their lowercased names."""
+        return self._fact_scan[0]
+
+    @property
+    def has_mixed_grain_fact(self) -> bool:
+        """Whether any fact table describes a mixed grain."""
+        return self._fact_scan[1]
+
+    @property
+    def has_dual_dates(self) -> bool:
+        """Whether any fact table carries both event/record and business dates."""
+        return self._fact_scan[2]
+
+    @cached_property
+    def dimensions(self) -> list[tuple[str, DimensionTable]]:
+        """Dimension tables paired with their lowercased names."""
+        return [(d.name.lower(), d) for d in self.schema.dimension_tables]
+
+    @cached_property
+    def bridges(self) -> list[tuple[str, BridgeTable]]:
+        """Bridge tables paired with their lowercased names."""
+        return [(bt.name.lower(), bt) for bt in self.schema.bridge_tables]
+
+    def find_fact(self, keyword: str) -> FactTable | None:
+        """First fact table whose name contains keyword (lowercase)."""
+        if keyword not in self._fact_matches:
+            self._fact_matches[keyword] = next(
+                (ft for name, ft in self.facts if keyword in name), None
+            )
+        return self._fact_matches[keyword]
+
+    def find_dimension(self, keyword: str) -> DimensionTable | None:
+        """First dimension table whose name contains keyword (lowercase)."""
+        if keyword not in self._dimension_matches:
+            self._dimension_matches[keyword] = next(
+                (d for name, d in self.dimensions if keyword in name), None
+            )
+        return self._dimension_matches[keyword]
+
+    def has_bridge(self, keyword: str) -> bool:
+        """Whether any bridge table name contains keyword (lowercase)."""
+        return any(keyword in name for name, _ in self.bridges)
+
+
+# Scenario text is static; prototypes are built once at import and shared
+# (scenarios whose text depends on the schema are copied with replace()).
+_MIXED_GRAIN_SCENARIO = QueryScenario(
+    scenario_name="The Mixed Grain Trap",
+    business_question="How many items did we sell last Tuesday?",
+    setup_description=(
+        "Transaction TXN-001 has 3 line items (items A, B, C).\n"
+        "Transaction TXN-002 is receipt-level only (total: 5 items, no breakdown)."
+    ),
+    expected_answer="8 items (3 + 5)",
+    actual_with_schema=(
+        "Either 2 items (counting rows), or 8 items (if you sum quantity), "
+        "but the grain inconsistency makes this query unreliable."
+    ),
+    why_wrong=(
+        "The fact table mixes line-item rows with receipt-level rows. "
+        "COUNT(*) counts rows, not items. SUM(quantity) might work "
+        "if all rows have quantity, but the semantic meaning differs."
+    ),
+    root_cause="Fact table has mixed grain without clear delineation",
+    events_involved=("TXN-001 (3 lines)", "TXN-002 (receipt only)"),
+    severity="critical",
+)
+
+_PAYMENT_FAN_OUT_SCENARIO = QueryScenario(
+    scenario_name="The Payment Fan-Out",
+    business_question="What was total revenue last week?",
+    setup_description=(
+        "Transaction TXN-100 is for $100, paid $60 cash + $40 credit.\n"
+        "Transaction TXN-101 is for $50, paid entirely by gift card."
+    ),
+    expected_answer="$150 total revenue",
+    actual_with_schema=(
+        "If payments are modeled as dimension rows joined to facts, "
+        "TXN-100 appears twice (once per payment method), "
+        "giving $200 ($100 + $100 + $50) or worse."
+    ),
+    why_wrong=(
+        "Without proper payment modeling, joining to payment data "
+        "causes fan-out, duplicating the transaction amounts."
+    ),
+    root_cause="No bridge table or separate fact for multiple payments",
+    events_involved=("TXN-100 ($60 + $40)", "TXN-101 ($50)"),
+    severity="major",
+)
+
+_BACKDATED_CORRECTION_SCENARIO = QueryScenario(
+    scenario_name="The Backdated Correction",
+    business_question="What were total sales on January 15th?",
+    setup_description=(
+        "TXN-500 was recorded on Jan 15 for $100.\n"
+        "On Jan 20, a manager corrected TXN-500's amount to $150.\n"
+        "The correction is backdated to be effective Jan 15."
+    ),
+    expected_answer="$150 (the corrected amount)",
+    actual_with_schema=(
+        "Either $100 (original), $150 (if overwritten), or $250 "
+        "(if both records exist without clear business date)."
+    ),
+    why_wrong=(
+        "The schema doesn't distinguish between event timestamp "
+        "(when recorded) and business effective date (when it applies). "
+        "This makes it impossible to correctly report Jan 15 sales."
+    ),
+    root_cause="No business_effective_date column separate from event_timestamp",
+    events_involved=("TXN-500 original ($100)", "CORR-987 ($150, effective Jan 15)"),
+    severity="major",
+)
+
+_REWRITTEN_HISTORY_SCENARIO = QueryScenario(
+    scenario_name="The Rewritten History",
+    business_question="What were sales by product category in Q1?",
+    setup_description=(
+        "Product SKU-123 was in 'Electronics' for January and February.\n"
+        "In March, SKU-123 was moved to 'Clearance' category.\n"
+        "SKU-123 had $10,000 in Q1 sales."
+    ),
+    expected_answer="$10,000 in Electronics (where it was when sold)",
+    actual_with_schema=(
+        "$10,000 shows as 'Clearance' because Type 1 SCD overwrote "
+        "the category. Historical category assignment is lost."
+    ),
+    why_wrong=(
+        "Type 1 SCD overwrites attributes without preserving history. "
+        "All historical sales now show current category values, "
+        "making historical category analysis impossible."
+    ),
+    root_cause="dim_product does not use Type 2",  # filled in with the actual SCD type
+    events_involved=("SKU-123 sales in Jan/Feb", "Category change in March"),
+    severity="major",
+)
+
+_MIDNIGHT_SALE_SCENARIO = QueryScenario(
+    scenario_name="The Midnight Sale",
+    business_question="What were sales for Monday vs Tuesday?",
+    setup_description=(
+        "Transaction at 11:55 PM Monday is recorded in the system.\n"
+        "Due to overnight processing, the event timestamp is 12:05 AM Tuesday.\n"
+        "The business considers this a Monday sale."
+    ),
+    expected_answer="Sale counts toward Monday",
+    actual_with_schema=(
+        "If using event timestamp for the date dimension, "
+        "this sale appears on Tuesday's report."
+    ),
+    why_wrong=(
+        "The business date (Monday) differs from the system timestamp (Tuesday). "
+        "Without explicit business date tracking, date-based reports are wrong "
+        "for all late-night transactions."
+    ),
+    root_cause="Schema uses timestamp instead of business effective date",
+    events_involved=("Late-night transaction crossing midnight",),
+    severity="moderate",
+)
+
+_ORPHAN_RETURN_SCENARIO = QueryScenario(
+    scenario_name="The Orphan Return",
+    business_question="What is customer C-100's lifetime value?",
+    setup_description=(
+        "Customer C-100 made purchases totaling $500.\n"
+        "C-100 returned a $50 item without a receipt (allowed by policy).\n"
+        "The return has no original_transaction_id."
+    ),
+    expected_answer="$450 ($500 purchases - $50 return)",
+    actual_with_schema=(
+        "Either $500 (return not linked to customer) or error "
+        "(if original_transaction_id is required but NULL)."
+    ),
+    why_wrong=(
+        "Returns without receipts can't be linked to original transactions. "
+        "If the schema requires this link, orphan returns are dropped. "
+        "If it's missing, returns can't be attributed to customers."
+    ),
+    root_cause="Return fact doesn't handle NULL original_transaction_id",
+    events_involved=("C-100 purchases ($500)", "Orphan return ($50)"),
+    severity="major",
+)
+
+_MYSTERY_REFUND_SCENARIO = QueryScenario(
+    scenario_name="The Mystery Refund",
+    business_question="What's our refund rate as a percentage of sales?",
+    setup_description=(
+        "Product sold for $100.\n"
+        "Customer returns it, but manager overrides refund to $120 "
+        "(goodwill gesture due to inconvenience)."
+    ),
+    expected_answer="Depends on business definition - $100 or $120?",
+    actual_with_schema=(
+        "If schema only stores refund amount, you get 120% refund rate. "
+        "If it only stores original price, you miss the actual cash out."
+    ),
+    why_wrong=(
+        "The shop allows arbitrary price overrides on returns. "
+        "Without tracking both original and refund amounts, "
+        "financial reconciliation is impossible."
+    ),
+    root_cause="Schema doesn't capture both original_price and actual_refund",
+    events_involved=("Sale ($100)", "Return ($120 override)"),
+    severity="moderate",
+)
+
+
 def generate_grain_scenarios(
     config: ShopConfiguration,
     schema: SchemaSubmission,
     result: EvaluationResult,
+    index: SchemaIndex | None = None,
 ) -> list[QueryScenario]:
     """Generate scenarios that demonstrate grain problems."""
     scenarios: list[QueryScenario] = []
+    if index is None:
+        index = SchemaIndex.build(schema)
 
     # Mixed grain scenario
     if config.transactions.grain == TransactionGrain.MIXED:
         # Check if schema has mixed grain issues
-        has_mixed_grain_fact = any(
-            "mixed" in ft.grain_description.lower() or "or" in ft.grain_description.lower()
-            for ft in schema.fact_tables
-        )
-
-        if has_mixed_grain_fact:
-            scenarios.append(QueryScenario(
-                scenario_name="The Mixed Grain Trap",
-                business_question="How many items did we sell last Tuesday?",
-                setup_description=(
-                    "Transaction TXN-001 has 3 line items (items A, B, C).\n"
-                    "Transaction TXN-002 is receipt-level only (total: 5 items, no breakdown)."
-                ),
-                expected_answer="8 items (3 + 5)",
-                actual_with_schema=(
-                    "Either 2 items (counting rows), or 8 items (if you sum quantity), "
-                    "but the grain inconsistency makes this query unreliable."
-                ),
-                why_wrong=(
-                    "The fact table mixes line-item rows with receipt-level rows. "
-                    "COUNT(*) counts rows, not items. SUM(quantity) might work "
-                    "if all rows have quantity, but the semantic meaning differs."
-                ),
-                root_cause="Fact table has mixed grain without clear delineation",
-                events_involved=["TXN-001 (3 lines)", "TXN-002 (receipt only)"],
-                severity="critical",
-            ))
+        if index.has_mixed_grain_fact:
+            scenarios.append(_MIXED_GRAIN_SCENARIO)
 
     # Multiple payments fan-out
     if config.transactions.multiple_payments:
-        # Check if there's no bridge table for payments
-        has_payment_bridge = any(
-            "payment" in bt.name.lower() for bt in schema.bridge_tables
-        )
-        has_payment_fact = any(
-            "payment" in ft.name.lower() for ft in schema.fact_tables
-        )
-
-        if not has_payment_bridge and not has_payment_fact:
-            scenarios.append(QueryScenario(
-                scenario_name="The Payment Fan-Out",
-                business_question="What was total revenue last week?",
-                setup_description=(
-                    "Transaction TXN-100 is for $100, paid $60 cash + $40 credit.\n"
-                    "Transaction TXN-101 is for $50, paid entirely by gift card."
-                ),
-                expected_answer="$150 total revenue",
-                actual_with_schema=(
-                    "If payments are modeled as dimension rows joined to facts, "
-                    "TXN-100 appears twice (once per payment method), "
-                    "giving $200 ($100 + $100 + $50) or worse."
-                ),
-                why_wrong=(
-                    "Without proper payment modeling, joining to payment data "
-                    "causes fan-out, duplicating the transaction amounts."
-                ),
-                root_cause="No bridge table or separate fact for multiple payments",
-                events_involved=["TXN-100 ($60 + $40)", "TXN-101 ($50)"],
-                severity="major",
-            ))
+        # Check if there's no bridge table for payments (bridges are few, so
+        # look there before scanning the fact tables)
+        if not index.has_bridge("payment") and index.find_fact("payment") is None:
+            scenarios.append(_PAYMENT_FAN_OUT_SCENARIO)
 
     return scenarios
 
@@ -92,100 +301,33 @@ def generate_temporal_scenarios(
     config: ShopConfiguration,
     schema: SchemaSubmission,
     result: EvaluationResult,
+    index: SchemaIndex | None = None,
 ) -> list[QueryScenario]:
     """Generate scenarios that demonstrate temporal problems."""
     scenarios: list[QueryScenario] = []
+    if index is None:
+        index = SchemaIndex.build(schema)
 
     # Backdated corrections
     if config.time.backdated_corrections:
         # Check if schema distinguishes event time from business date
-        has_dual_dates = False
-        for ft in schema.fact_tables:
-            cols = [gc.name.lower() for gc in ft.grain_columns]
-            cols += [dk.lower() for dk in ft.dimension_keys]
-            if ("event" in " ".join(cols) or "record" in " ".join(cols)) and "business" in " ".join(cols):
-                has_dual_dates = True
-
-        if not has_dual_dates:
-            scenarios.append(QueryScenario(
-                scenario_name="The Backdated Correction",
-                business_question="What were total sales on January 15th?",
-                setup_description=(
-                    "TXN-500 was recorded on Jan 15 for $100.\n"
-                    "On Jan 20, a manager corrected TXN-500's amount to $150.\n"
-                    "The correction is backdated to be effective Jan 15."
-                ),
-                expected_answer="$150 (the corrected amount)",
-                actual_with_schema=(
-                    "Either $100 (original), $150 (if overwritten), or $250 "
-                    "(if both records exist without clear business date)."
-                ),
-                why_wrong=(
-                    "The schema doesn't distinguish between event timestamp "
-                    "(when recorded) and business effective date (when it applies). "
-                    "This makes it impossible to correctly report Jan 15 sales."
-                ),
-                root_cause="No business_effective_date column separate from event_timestamp",
-                events_involved=["TXN-500 original ($100)", "CORR-987 ($150, effective Jan 15)"],
-                severity="major",
-            ))
+        if not index.has_dual_dates:
+            scenarios.append(_BACKDATED_CORRECTION_SCENARIO)
 
     # SCD for changing hierarchies
     if config.products.hierarchy_change_frequency != ProductHierarchyChangeFrequency.NONE:
         # Check product dimension SCD type
-        product_dim = next(
-            (d for d in schema.dimension_tables if "product" in d.name.lower()),
-            None
-        )
+        product_dim = index.find_dimension("product")
 
         if product_dim and product_dim.scd_strategy in (SCDType.TYPE_1, SCDType.NONE, SCDType.TYPE_0):
-            scenarios.append(QueryScenario(
-                scenario_name="The Rewritten History",
-                business_question="What were sales by product category in Q1?",
-                setup_description=(
-                    "Product SKU-123 was in 'Electronics' for January and February.\n"
-                    "In March, SKU-123 was moved to 'Clearance' category.\n"
-                    "SKU-123 had $10,000 in Q1 sales."
-                ),
-                expected_answer="$10,000 in Electronics (where it was when sold)",
-                actual_with_schema=(
-                    "$10,000 shows as 'Clearance' because Type 1 SCD overwrote "
-                    "the category. Historical category assignment is lost."
-                ),
-                why_wrong=(
-                    "Type 1 SCD overwrites attributes without preserving history. "
-                    "All historical sales now show current category values, "
-                    "making historical category analysis impossible."
-                ),
+            scenarios.append(replace(
+                _REWRITTEN_HISTORY_SCENARIO,
                 root_cause=f"dim_product uses {product_dim.scd_strategy.value} instead of Type 2",
-                events_involved=["SKU-123 sales in Jan/Feb", "Category change in March"],
-                severity="major",
             ))
 
     # Timestamp vs business date
     if config.time.timestamp_business_date_relation == TimestampBusinessDateRelation.DIFFERENT:
-        scenarios.append(QueryScenario(
-            scenario_name="The Midnight Sale",
-            business_question="What were sales for Monday vs Tuesday?",
-            setup_description=(
-                "Transaction at 11:55 PM Monday is recorded in the system.\n"
-                "Due to overnight processing, the event timestamp is 12:05 AM Tuesday.\n"
-                "The business considers this a Monday sale."
-            ),
-            expected_answer="Sale counts toward Monday",
-            actual_with_schema=(
-                "If using event timestamp for the date dimension, "
-                "this sale appears on Tuesday's report."
-            ),
-            why_wrong=(
-                "The business date (Monday) differs from the system timestamp (Tuesday). "
-                "Without explicit business date tracking, date-based reports are wrong "
-                "for all late-night transactions."
-            ),
-            root_cause="Schema uses timestamp instead of business effective date",
-            events_involved=["Late-night transaction crossing midnight"],
-            severity="moderate",
-        ))
+        scenarios.append(_MIDNIGHT_SALE_SCENARIO)
 
     return scenarios
 
@@ -194,71 +336,33 @@ def generate_semantic_scenarios(
     config: ShopConfiguration,
     schema: SchemaSubmission,
     result: EvaluationResult,
+    index: SchemaIndex | None = None,
 ) -> list[QueryScenario]:
     """Generate scenarios that demonstrate semantic mismatches."""
     scenarios: list[QueryScenario] = []
+    if index is None:
+        index = SchemaIndex.build(schema)
 
     # Returns without original reference
     if config.returns.reference_policy == ReturnsReferencePolicy.SOMETIMES:
-        return_fact = next(
-            (ft for ft in schema.fact_tables if "return" in ft.name.lower()),
-            None
-        )
+        return_fact = index.find_fact("return")
 
         if return_fact:
+            # GrainColumn has no nullability flag; a column signals an optional
+            # reference through its name or the dimension it references
             has_optional_ref = any(
-                "original" in gc.name.lower() or "nullable" in str(gc)
+                "original" in gc.name.lower()
+                or "nullable" in gc.name
+                or "nullable" in (gc.references_dimension or "")
                 for gc in return_fact.grain_columns
             )
 
             if not has_optional_ref:
-                scenarios.append(QueryScenario(
-                    scenario_name="The Orphan Return",
-                    business_question="What is customer C-100's lifetime value?",
-                    setup_description=(
-                        "Customer C-100 made purchases totaling $500.\n"
-                        "C-100 returned a $50 item without a receipt (allowed by policy).\n"
-                        "The return has no original_transaction_id."
-                    ),
-                    expected_answer="$450 ($500 purchases - $50 return)",
-                    actual_with_schema=(
-                        "Either $500 (return not linked to customer) or error "
-                        "(if original_transaction_id is required but NULL)."
-                    ),
-                    why_wrong=(
-                        "Returns without receipts can't be linked to original transactions. "
-                        "If the schema requires this link, orphan returns are dropped. "
-                        "If it's missing, returns can't be attributed to customers."
-                    ),
-                    root_cause="Return fact doesn't handle NULL original_transaction_id",
-                    events_involved=["C-100 purchases ($500)", "Orphan return ($50)"],
-                    severity="major",
-                ))
+                scenarios.append(_ORPHAN_RETURN_SCENARIO)
 
     # Arbitrary return pricing
     if config.returns.pricing_policy == ReturnsPricingPolicy.ARBITRARY_OVERRIDE:
-        scenarios.append(QueryScenario(
-            scenario_name="The Mystery Refund",
-            business_question="What's our refund rate as a percentage of sales?",
-            setup_description=(
-                "Product sold for $100.\n"
-                "Customer returns it, but manager overrides refund to $120 "
-                "(goodwill gesture due to inconvenience)."
-            ),
-            expected_answer="Depends on business definition - $100 or $120?",
-            actual_with_schema=(
-                "If schema only stores refund amount, you get 120% refund rate. "
-                "If it only stores original price, you miss the actual cash out."
-            ),
-            why_wrong=(
-                "The shop allows arbitrary price overrides on returns. "
-                "Without tracking both original and refund amounts, "
-                "financial reconciliation is impossible."
-            ),
-            root_cause="Schema doesn't capture both original_price and actual_refund",
-            events_involved=["Sale ($100)", "Return ($120 override)"],
-            severity="moderate",
-        ))
+        scenarios.append(_MYSTERY_REFUND_SCENARIO)
 
     return scenarios
 
@@ -270,13 +374,13 @@ def generate_all_scenarios(
 ) -> list[QueryScenario]:
     """Generate all applicable scenarios based on config and schema issues."""
     scenarios: list[QueryScenario] = []
+    index = SchemaIndex.build(schema)
 
-    scenarios.extend(generate_grain_scenarios(config, schema, result))
-    scenarios.extend(generate_temporal_scenarios(config, schema, result))
-    scenarios.extend(generate_semantic_scenarios(config, schema, result))
+    scenarios.extend(generate_grain_scenarios(config, schema, result, index))
+    scenarios.extend(generate_temporal_scenarios(config, schema, result, index))
+    scenarios.extend(generate_semantic_scenarios(config, schema, result, index))
 
     # Sort by severity
-    severity_order = {"critical": 0, "major": 1, "moderate": 2, "minor": 3}
-    scenarios.sort(key=lambda s: severity_order.get(s.severity, 99))
+    scenarios.sort(key=attrgetter("severity_rank"))
 
     return scenarios
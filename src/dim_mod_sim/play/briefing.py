@@ -1,18 +1,40 @@
 """Briefing generator for scenario presentation."""
 
-from rich.console import Console
+from collections.abc import Iterator, Mapping
+from types import MappingProxyType
+
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
 
 from dim_mod_sim.play.framing import (
     ADVERSARIAL_TAGLINES,
     DIFFICULTY_DESCRIPTIONS,
     DifficultyBriefing,
+    EnabledTrap,
     TrapCategory,
 )
 from dim_mod_sim.shop.config import ShopConfiguration
 from dim_mod_sim.shop.generator import extract_enabled_traps
 from dim_mod_sim.shop.options import Difficulty
 
+# Display order of trap categories in the briefing panel
+_TRAP_CATEGORY_ORDER: tuple[TrapCategory, ...] = (
+    TrapCategory.GRAIN,
+    TrapCategory.TEMPORAL,
+    TrapCategory.IDENTITY,
+    TrapCategory.SEMANTIC,
+    TrapCategory.RELATIONSHIP,
+)
+
+# Heading colour for each trap category in the briefing panel
+_CATEGORY_COLORS: Mapping[TrapCategory, str] = MappingProxyType({
+    TrapCategory.GRAIN: "red",
+    TrapCategory.TEMPORAL: "yellow",
+    TrapCategory.IDENTITY: "magenta",
+    TrapCategory.SEMANTIC: "cyan",
+    TrapCategory.RELATIONSHIP: "blue",
+})
+
 
 class BriefingGenerator:
     """Generates difficulty briefings from shop configurations."""
@@ -39,6 +61,16 @@ class BriefingGenerator:
         )
 
 
+def _format_category(
+    category: TrapCategory, traps: list[EnabledTrap], color: str
+) -> Iterator[str]:
+    """Yield the heading, trap bullets and blank separator for one category."""
+    yield f"[bold {color}]{category.value.upper()}[/bold {color}]"
+    for trap in traps:
+        yield f"  - {trap.name}"
+    yield ""
+
+
 def display_briefing(
     briefing: DifficultyBriefing,
     config: ShopConfiguration,
@@ -46,46 +78,40 @@ def display_briefing(
     num_events: int,
     console: Console,
 ) -> None:
-    """Display the difficulty briefing using Rich console."""
+    """Display the difficulty briefing using Rich console.
+
+    The sections are collected into one Group and printed with a single call.
+    """
+    renderables: list[RenderableType] = []
+
     # Header panel
-    console.print()
-    console.print(Panel.fit(
+    renderables.append("")
+    renderables.append(Panel.fit(
         f"[bold]{briefing.difficulty_name} SCENARIO[/bold]\n\n"
         f"Seed: {seed}  |  Shop: {config.shop_name}  |  Events: {num_events:,}",
         border_style="bold",
     ))
 
     # Adversarial tagline
-    console.print()
-    console.print(f"[bold italic]{briefing.adversarial_tagline}[/bold italic]")
-    console.print()
+    renderables.append("")
+    renderables.append(f"[bold italic]{briefing.adversarial_tagline}[/bold italic]")
+    renderables.append("")
 
     # Traps by category
     traps_by_cat = briefing.traps_by_category
     if traps_by_cat:
-        trap_lines: list[str] = []
-
-        category_colors = {
-            TrapCategory.GRAIN: "red",
-            TrapCategory.TEMPORAL: "yellow",
-            TrapCategory.IDENTITY: "magenta",
-            TrapCategory.SEMANTIC: "cyan",
-            TrapCategory.RELATIONSHIP: "blue",
-        }
-
-        for category in TrapCategory:
-            if category not in traps_by_cat:
-                continue
-
-            color = category_colors.get(category, "white")
-            trap_lines.append(f"[bold {color}]{category.value.upper()}[/bold {color}]")
-
-            for trap in traps_by_cat[category]:
-                trap_lines.append(f"  - {trap.name}")
-
-            trap_lines.append("")
-
-        console.print(Panel(
+        trap_lines = [
+            line
+            for category in _TRAP_CATEGORY_ORDER
+            if category in traps_by_cat
+            for line in _format_category(
+                category,
+                traps_by_cat[category],
+                _CATEGORY_COLORS.get(category, "white"),
+            )
+        ]
+
+        renderables.append(Panel(
             "\n".join(trap_lines).strip(),
             title="[bold]Traps Enabled[/bold]",
             border_style="dim",
@@ -93,7 +119,10 @@ def display_briefing(
 
     # Threat summary
     if briefing.threat_summary:
-        console.print()
-        console.print(f"[bold]{config.shop_name}[/bold] will try to break your model by:")
-        for threat in briefing.threat_summary:
-            console.print(f"  [dim]-[/dim] {threat}")
+        renderables.append("")
+        renderables.append(f"[bold]{config.shop_name}[/bold] will try to break your model by:")
+        renderables.extend(
+            f"  [dim]-[/dim] {threat}" for threat in briefing.threat_summary
+        )
+
+    console.print(Group(*renderables))
@@ -1,5 +1,6 @@
 """Difficulty framing and trap detection models."""
 
+from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -14,7 +15,7 @@ class TrapCategory(str, Enum):
     RELATIONSHIP = "relationship"
 
 
-@dataclass
+@dataclass(slots=True)
 class EnabledTrap:
     """A specific modeling trap that is active in a scenario."""
 
@@ -24,7 +25,7 @@ class EnabledTrap:
     config_source: str  # which config option enables this
 
 
-@dataclass
+@dataclass(slots=True)
 class DifficultyBriefing:
     """Complete difficulty briefing for a scenario."""
 
@@ -33,20 +34,32 @@ class DifficultyBriefing:
     enabled_traps: list[EnabledTrap] = field(default_factory=list)
     adversarial_tagline: str = ""
 
+    # Caches for the derived views below (cached_property needs a __dict__)
+    _traps_by_category: dict[TrapCategory, list[EnabledTrap]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _threat_summary: list[str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @property
     def traps_by_category(self) -> dict[TrapCategory, list[EnabledTrap]]:
-        """Group traps by category."""
-        result: dict[TrapCategory, list[EnabledTrap]] = {}
-        for trap in self.enabled_traps:
-            if trap.category not in result:
-                result[trap.category] = []
-            result[trap.category].append(trap)
-        return result
+        """Group traps by category (computed once; enabled_traps is fixed after creation)."""
+        if self._traps_by_category is None:
+            result: defaultdict[TrapCategory, list[EnabledTrap]] = defaultdict(list)
+            for trap in self.enabled_traps:
+                result[trap.category].append(trap)
+            self._traps_by_category = dict(result)
+        return self._traps_by_category
 
     @property
     def threat_summary(self) -> list[str]:
         """Generate a list of threat descriptions for display."""
-        return [trap.threat_description for trap in self.enabled_traps[:5]]
+        if self._threat_summary is None:
+            self._threat_summary = [
+                trap.threat_description for trap in self.enabled_traps[:5]
+            ]
+        return self._threat_summary
 
 
 # Difficulty descriptions
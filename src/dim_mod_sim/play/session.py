@@ -1,24 +1,55 @@
-"""Play session orchestrator for interactive challenges."""
+"""Play session orchestrator for interactive challenges.
+
+Generators, the evaluator and prompt helpers are imported inside the methods
+that use them, so importing this module (e.g. for CLI startup) stays cheap.
+"""
+
+from __future__ import annotations
 
 import json
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from rich.console import Console
 from rich.panel import Panel
-from rich.prompt import Confirm, Prompt
+from rich.text import Text
 
-from dim_mod_sim.description.generator import DescriptionGenerator
-from dim_mod_sim.events.generator import EventGenerator
-from dim_mod_sim.evaluator.engine import SchemaEvaluator
 from dim_mod_sim.evaluator.feedback import ActionableFeedback, ViolationType
-from dim_mod_sim.play.briefing import BriefingGenerator, display_briefing
+from dim_mod_sim.progress.models import compute_schema_hash
 from dim_mod_sim.progress.tracker import ProgressTracker
-from dim_mod_sim.scaffold.generator import ScaffoldGenerator
-from dim_mod_sim.schema.parser import parse_schema
-from dim_mod_sim.shop.config import ShopConfiguration
-from dim_mod_sim.shop.generator import ShopGenerator
 from dim_mod_sim.shop.options import Difficulty
 
+if TYPE_CHECKING:
+    from dim_mod_sim.evaluator.engine import SchemaEvaluator
+    from dim_mod_sim.evaluator.result import EvaluationResult
+    from dim_mod_sim.play.framing import DifficultyBriefing
+    from dim_mod_sim.shop.config import ShopConfiguration
+
+# Evaluation results kept for resubmitted (identical) schemas
+MAX_CACHED_RESULTS = 8
+
+# Inputs at the schema prompt that end the evaluation loop
+_QUIT_WORDS = frozenset({"quit", "q", "exit", "done"})
+
+# Panel title and colour for each violation type
+_VIOLATION_LABELS: dict[ViolationType, tuple[str, str]] = {
+    ViolationType.GRAIN_VIOLATION: ("GRAIN VIOLATIONS", "red"),
+    ViolationType.TEMPORAL_LIE: ("TEMPORAL LIES", "yellow"),
+    ViolationType.SEMANTIC_MISMATCH: ("SEMANTIC MISMATCHES", "magenta"),
+    ViolationType.DATA_LOSS: ("DATA LOSS RISKS", "red"),
+    ViolationType.FAN_OUT_RISK: ("FAN-OUT RISKS", "red"),
+    ViolationType.OVER_MODELING: ("OVER-MODELING", "cyan"),
+    ViolationType.UNDER_MODELING: ("UNDER-MODELING", "blue"),
+}
+
+# Styled badge for each severity value (prebuilt, so no markup parsing per panel)
+_SEVERITY_BADGES: dict[str, Text] = {
+    "critical": Text("CRITICAL", style="bold red"),
+    "major": Text("MAJOR", style="bold yellow"),
+    "moderate": Text("MODERATE", style="yellow"),
+    "minor": Text("MINOR", style="dim"),
+}
+
 
 class PlaySession:
     """Orchestrates an interactive play session."""
@@ -48,6 +79,11 @@ class PlaySession:
         self.config: ShopConfiguration | None = None
         self.events = None
         self.evaluator: SchemaEvaluator | None = None
+        # Derived from the (fixed) config; generated on first use
+        self._briefing: DifficultyBriefing | None = None
+        self._description: str | None = None
+        # Schema hash -> result; config and events are fixed per session
+        self._result_cache: dict[str, EvaluationResult] = {}
 
     def run(self) -> None:
         """Run the complete play session."""
@@ -63,6 +99,10 @@ class PlaySession:
 
     def _generate_scenario(self) -> None:
         """Generate the shop configuration and events."""
+        from dim_mod_sim.evaluator.engine import SchemaEvaluator
+        from dim_mod_sim.events.generator import EventGenerator
+        from dim_mod_sim.shop.generator import ShopGenerator
+
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
         # Generate shop configuration
@@ -72,8 +112,7 @@ class PlaySession:
 
         # Save configuration
         config_path = self.output_dir / "shop_config.json"
-        with open(config_path, "w") as f:
-            json.dump(self.config.model_dump(mode="json"), f, indent=2)
+        config_path.write_text(self.config.model_dump_json(indent=2))
 
         # Generate events
         with self.console.status(f"[bold]Generating {self.num_events:,} events...[/bold]"):
@@ -86,7 +125,7 @@ class PlaySession:
         # Save events
         events_path = self.output_dir / "events.json"
         with open(events_path, "w") as f:
-            json.dump(self.events.to_dict(), f, indent=2)
+            self.events.write_json(f)
 
         # Initialize evaluator
         self.evaluator = SchemaEvaluator(self.config, self.events)
@@ -98,11 +137,14 @@ class PlaySession:
         if self.config is None:
             return
 
-        briefing_gen = BriefingGenerator(self.config, self.difficulty)
-        briefing = briefing_gen.generate()
+        from dim_mod_sim.play.briefing import BriefingGenerator, display_briefing
+
+        if self._briefing is None:
+            briefing_gen = BriefingGenerator(self.config, self.difficulty)
+            self._briefing = briefing_gen.generate()
 
         display_briefing(
-            briefing,
+            self._briefing,
             self.config,
             self.seed,
             len(self.events.events) if self.events else self.num_events,
@@ -114,15 +156,20 @@ class PlaySession:
         if self.config is None:
             return
 
+        from rich.prompt import Confirm
+
+        from dim_mod_sim.description.generator import DescriptionGenerator
+
         self.console.print()
         if Confirm.ask("Show full business description?", default=False):
-            desc_gen = DescriptionGenerator(self.config)
-            description = desc_gen.generate()
+            if self._description is None:
+                desc_gen = DescriptionGenerator(self.config)
+                self._description = desc_gen.generate()
+            description = self._description
 
             # Save description
             desc_path = self.output_dir / "description.md"
-            with open(desc_path, "w") as f:
-                f.write(description)
+            desc_path.write_text(description)
 
             self.console.print()
             self.console.print(Panel(description, title="Business Description"))
@@ -133,13 +180,14 @@ class PlaySession:
         if self.config is None:
             return
 
+        from dim_mod_sim.scaffold.generator import ScaffoldGenerator
+
         with self.console.status("[bold]Generating schema scaffold...[/bold]"):
             scaffold_gen = ScaffoldGenerator(self.config)
             scaffold = scaffold_gen.generate()
 
         scaffold_path = self.output_dir / "scaffold.json"
-        with open(scaffold_path, "w") as f:
-            json.dump(scaffold.to_dict(), f, indent=2)
+        scaffold_path.write_text(json.dumps(scaffold.to_dict(), indent=2))
 
         self.console.print()
         self.console.print(Panel.fit(
@@ -155,6 +203,8 @@ class PlaySession:
         if self.evaluator is None:
             return
 
+        from rich.prompt import Confirm, Prompt
+
         attempt = 0
 
         self.console.print()
@@ -168,7 +218,7 @@ class PlaySession:
                 default="quit",
             )
 
-            if schema_path.lower() in ("quit", "q", "exit", "done"):
+            if schema_path.lower() in _QUIT_WORDS:
                 break
 
             path = Path(schema_path)
@@ -190,13 +240,23 @@ class PlaySession:
         if self.evaluator is None:
             return
 
-        with self.console.status("[bold]Evaluating schema...[/bold]"):
-            schema = parse_schema(schema_path)
-            result = self.evaluator.evaluate(schema)
+        from dim_mod_sim.schema.parser import parse_schema
 
-            # Load schema dict for progress tracking
-            with open(schema_path) as f:
-                schema_dict = json.load(f)
+        with self.console.status("[bold]Evaluating schema...[/bold]"):
+            # Read the file once; the dict is also needed for progress tracking
+            schema_dict = json.loads(schema_path.read_text())
+            schema_hash = compute_schema_hash(schema_dict)
+
+            result = self._result_cache.get(schema_hash)
+            if result is None:
+                schema = parse_schema(schema_dict)
+                result = self.evaluator.evaluate(schema)
+                if len(self._result_cache) >= MAX_CACHED_RESULTS:
+                    # Evict the oldest entry
+                    del self._result_cache[next(iter(self._result_cache))]
+                self._result_cache[schema_hash] = result
+            else:
+                self.console.print("[dim]Identical schema - reusing prior result[/dim]")
 
         feedback = ActionableFeedback.from_result(result)
 
@@ -206,6 +266,7 @@ class PlaySession:
             difficulty=self.difficulty.value,
             result=result,
             schema_dict=schema_dict,
+            schema_hash=schema_hash,
         )
 
         # Header with score
@@ -242,16 +303,6 @@ class PlaySession:
 
     def _display_violations(self, feedback: ActionableFeedback) -> None:
         """Display violations grouped by category."""
-        violation_labels = {
-            ViolationType.GRAIN_VIOLATION: ("GRAIN VIOLATIONS", "red"),
-            ViolationType.TEMPORAL_LIE: ("TEMPORAL LIES", "yellow"),
-            ViolationType.SEMANTIC_MISMATCH: ("SEMANTIC MISMATCHES", "magenta"),
-            ViolationType.DATA_LOSS: ("DATA LOSS RISKS", "red"),
-            ViolationType.FAN_OUT_RISK: ("FAN-OUT RISKS", "red"),
-            ViolationType.OVER_MODELING: ("OVER-MODELING", "cyan"),
-            ViolationType.UNDER_MODELING: ("UNDER-MODELING", "blue"),
-        }
-
         # Show top violations (limit to avoid overwhelming output)
         shown = 0
         max_to_show = 5
@@ -263,25 +314,22 @@ class PlaySession:
                     self.console.print(f"\n[dim]...and {remaining} more issues[/dim]")
                 break
 
-            label, color = violation_labels.get(
+            label, color = _VIOLATION_LABELS.get(
                 v.violation_type,
                 (v.violation_type.value.upper(), "white"),
             )
 
-            severity_badge = {
-                "critical": "[bold red]CRITICAL[/bold red]",
-                "major": "[bold yellow]MAJOR[/bold yellow]",
-                "moderate": "[yellow]MODERATE[/yellow]",
-                "minor": "[dim]MINOR[/dim]",
-            }.get(v.severity.value, v.severity.value)
+            severity_badge = _SEVERITY_BADGES.get(v.severity.value) or Text(v.severity.value)
 
-            content = f"{severity_badge} {v.what_went_wrong}"
+            content = Text.assemble(severity_badge, " ", v.what_went_wrong)
 
             if v.consequence:
-                content += f"\n[dim]→ {v.consequence}[/dim]"
+                content.append(f"\n→ {v.consequence}", style="dim")
 
             if v.fix_hint:
-                content += f"\n[bold]Fix:[/bold] {v.fix_hint}"
+                content.append("\n")
+                content.append("Fix:", style="bold")
+                content.append(f" {v.fix_hint}")
 
             self.console.print()
             self.console.print(Panel(
@@ -293,6 +341,9 @@ class PlaySession:
 
     def _show_session_summary(self) -> None:
         """Show summary when session ends."""
+        # Persist the attempts journaled during this session
+        self.progress_tracker.flush()
+
         # Show progress for this scenario
         self.console.print()
         self.progress_tracker.display_progress(
@@ -4,12 +4,16 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from pydantic import BaseModel
 
+# Attempt records kept per scenario; older ones are dropped (only the count remains)
+MAX_ATTEMPTS = 100
+
 
 class AttemptRecord(BaseModel):
     """Record of a single evaluation attempt."""
@@ -30,7 +34,8 @@ class ScenarioProgress(BaseModel):
     difficulty: str
     best_score: int = 0
     best_percentage: float = 0.0
-    attempts: list[AttemptRecord] = []
+    attempts: list[AttemptRecord] = []  # Most recent MAX_ATTEMPTS only
+    total_attempts: int = 0  # All attempts ever recorded, including dropped ones
     first_attempt: datetime | None = None
     last_attempt: datetime | None = None
 
@@ -48,9 +53,10 @@ class ScenarioProgress(BaseModel):
             Tuple of (is_improvement, is_regression) compared to previous attempt.
         """
         now = datetime.now()
-        percentage = (total_score / max_score * 100) if max_score > 0 else 0
+        percentage = (total_score / max_score * 100) if max_score > 0 else 0.0
 
-        attempt = AttemptRecord(
+        # Every field is computed here with its declared type, so skip validation
+        attempt = AttemptRecord.model_construct(
             timestamp=now,
             schema_hash=schema_hash,
             total_score=total_score,
@@ -60,15 +66,24 @@ class ScenarioProgress(BaseModel):
             deduction_count=deduction_count,
         )
 
+        return self.apply_attempt(attempt)
+
+    def apply_attempt(self, attempt: AttemptRecord) -> tuple[bool, bool]:
+        """Append an existing attempt record, updating first/last and best score.
+
+        Returns:
+            Tuple of (is_improvement, is_regression) compared to previous attempt.
+        """
         # Track first/last
         if self.first_attempt is None:
-            self.first_attempt = now
-        self.last_attempt = now
+            self.first_attempt = attempt.timestamp
+        self.last_attempt = attempt.timestamp
 
         # Check for improvement/regression vs previous attempt
         is_improvement = False
         is_regression = False
 
+        percentage = attempt.percentage
         if self.attempts:
             prev_percentage = self.attempts[-1].percentage
             if percentage > prev_percentage:
@@ -77,18 +92,22 @@ class ScenarioProgress(BaseModel):
                 is_regression = True
 
         # Update best score
-        if total_score > self.best_score:
-            self.best_score = total_score
+        if attempt.total_score > self.best_score:
+            self.best_score = attempt.total_score
             self.best_percentage = percentage
 
+        self.total_attempts = self.attempt_count + 1
         self.attempts.append(attempt)
+        if len(self.attempts) > MAX_ATTEMPTS:
+            self.attempts = self.attempts[-MAX_ATTEMPTS:]
 
         return is_improvement, is_regression
 
     @property
     def attempt_count(self) -> int:
         """Number of attempts for this scenario."""
-        return len(self.attempts)
+        # Files saved before total_attempts existed only have the attempt list
+        return max(self.total_attempts, len(self.attempts))
 
 
 class ProgressStore(BaseModel):
@@ -96,6 +115,9 @@ class ProgressStore(BaseModel):
 
     version: str = "1.0"
     scenarios: dict[str, ScenarioProgress] = {}
+    # Generation of the last attempt journal folded into this store; lets a
+    # journal that survived an interrupted flush be recognised and discarded
+    flushed_journal: str | None = None
 
     @staticmethod
     def _make_key(seed: int, difficulty: str) -> str:
@@ -151,22 +173,28 @@ class ProgressStore(BaseModel):
             return cls()
 
         try:
-            with open(path) as f:
-                data = json.load(f)
-            return cls.model_validate(data)
-        except (json.JSONDecodeError, ValueError):
-            # Corrupted file, start fresh
+            # Parse and validate in one step with pydantic's native JSON parser
+            return cls.model_validate_json(path.read_bytes())
+        except ValueError:
+            # Corrupted file (malformed JSON or failed validation), start fresh
             return cls()
 
     def save(self, path: Path) -> None:
-        """Save progress to file."""
+        """Save progress to file.
+
+        The compact JSON is written to a sibling temp file and moved into
+        place, so an interrupted save never leaves a truncated progress file.
+        """
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w") as f:
-            json.dump(self.model_dump(mode="json"), f, indent=2, default=str)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(self.model_dump_json(), encoding="utf-8")
+        os.replace(tmp, path)
 
 
 def compute_schema_hash(schema_dict: dict[str, Any]) -> str:
     """Compute a hash of a schema for deduplication."""
-    # Normalize the schema (sort keys) for consistent hashing
-    normalized = json.dumps(schema_dict, sort_keys=True)
-    return hashlib.sha256(normalized.encode()).hexdigest()[:16]
+    # Normalize the schema (sort keys, compact separators) for consistent hashing
+    normalized = json.dumps(schema_dict, sort_keys=True, separators=(",", ":"))
+    # Non-cryptographic dedup key: an 8-byte BLAKE2b digest gives the same
+    # 16 hex characters as the old truncated SHA-256 without the extra rounds
+    return hashlib.blake2b(normalized.encode(), digest_size=8).hexdigest()
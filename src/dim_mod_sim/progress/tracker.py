@@ -1,13 +1,31 @@
 """Progress tracker for managing evaluation history."""
 
+import json
 import os
+import time
+import uuid
+from collections.abc import Iterable
 from pathlib import Path
 
 from rich.console import Console
 from rich.panel import Panel
 
 from dim_mod_sim.evaluator.result import EvaluationResult
-from dim_mod_sim.progress.models import ProgressStore, ScenarioProgress, compute_schema_hash
+from dim_mod_sim.progress.models import (
+    AttemptRecord,
+    ProgressStore,
+    ScenarioProgress,
+    compute_schema_hash,
+)
+
+
+# Attempt history progress bars, indexed by number of filled cells
+BAR_WIDTH = 20
+_BARS = tuple("█" * i + "░" * (BAR_WIDTH - i) for i in range(BAR_WIDTH + 1))
+
+
+# (seconds per unit, unit label) for "last attempt" ages, largest unit first
+_TIME_BUCKETS = ((86400, "days"), (3600, "hours"), (60, "minutes"))
 
 
 def get_default_progress_path() -> Path:
@@ -22,11 +40,71 @@ def get_default_progress_path() -> Path:
 
 
 class ProgressTracker:
-    """Tracks evaluation progress across sessions."""
+    """Tracks evaluation progress across sessions.
+
+    Attempts are appended to a journal file next to the progress file; the
+    full store is only rewritten by flush(). Any journal left behind by an
+    unflushed session is replayed on load.
+
+    Each journal starts with a header line naming its generation, and the
+    store saved by flush() records the generation it folded in. A journal
+    whose generation the store already holds (flush interrupted before the
+    journal was deleted) is discarded rather than replayed twice.
+    """
 
     def __init__(self, path: Path | None = None) -> None:
         self.path = path or get_default_progress_path()
+        self.journal_path = self.path.with_name(self.path.name + ".journal")
         self.store = ProgressStore.load(self.path)
+        self._journal_generation: str | None = None
+        self._replay_journal()
+
+    def _replay_journal(self) -> None:
+        """Apply attempts journaled since the progress file was last saved."""
+        if not self.journal_path.exists():
+            return
+
+        with open(self.journal_path) as f:
+            try:
+                generation = json.loads(f.readline())["generation"]
+            except (ValueError, KeyError, TypeError):
+                # The header is written before any attempt, so a journal
+                # without one was interrupted before journaling anything
+                generation = None
+
+            if generation is not None and generation != self.store.flushed_journal:
+                self._replay_entries(f)
+                # Keep appending to the replayed journal until the next flush
+                self._journal_generation = generation
+                return
+
+        # Empty, or already folded into the progress file by a flush that
+        # was interrupted before deleting the journal
+        self.journal_path.unlink()
+
+    def _replay_entries(self, lines: Iterable[str]) -> None:
+        """Apply journaled attempt lines to the store."""
+        for line in lines:
+            try:
+                entry = json.loads(line)
+                attempt = AttemptRecord.model_validate(entry["attempt"])
+                scenario = self.store.get_or_create_scenario(
+                    entry["seed"], entry["difficulty"]
+                )
+            except (ValueError, KeyError, TypeError):
+                # Partially written line from an interrupted session
+                continue
+            scenario.apply_attempt(attempt)
+
+    def flush(self) -> None:
+        """Fold journaled attempts into the progress file."""
+        if self._journal_generation is None:
+            return
+
+        self.store.flushed_journal = self._journal_generation
+        self.store.save(self.path)
+        self.journal_path.unlink(missing_ok=True)
+        self._journal_generation = None
 
     def record_attempt(
         self,
@@ -34,23 +112,25 @@ class ProgressTracker:
         difficulty: str,
         result: EvaluationResult,
         schema_dict: dict,
+        schema_hash: str | None = None,
     ) -> tuple[bool, bool, bool]:
         """Record an evaluation attempt.
 
+        Callers that already hashed the schema can pass schema_hash to skip
+        recomputing it.
+
         Returns:
             Tuple of (is_improvement, is_regression, is_new_best).
         """
-        schema_hash = compute_schema_hash(schema_dict)
+        if schema_hash is None:
+            schema_hash = compute_schema_hash(schema_dict)
 
-        axis_scores = {
-            name: score.score
-            for name, score in result.axis_scores.items()
-        }
-
-        deduction_count = sum(
-            len(score.deductions)
-            for score in result.axis_scores.values()
-        )
+        # Collect per-axis scores and the total deduction count in one pass
+        axis_scores: dict[str, int] = {}
+        deduction_count = 0
+        for name, score in result.axis_scores.items():
+            axis_scores[name] = score.score
+            deduction_count += len(score.deductions)
 
         is_improvement, is_regression, is_new_best = self.store.record_attempt(
             seed=seed,
@@ -62,8 +142,21 @@ class ProgressTracker:
             schema_hash=schema_hash,
         )
 
-        # Save after each attempt
-        self.store.save(self.path)
+        # Journal the attempt; the full store is rewritten on flush()
+        attempt = self.store.get_scenario(seed, difficulty).attempts[-1]
+        if self._journal_generation is None:
+            # First attempt since the last flush starts a new journal
+            self._journal_generation = uuid.uuid4().hex
+            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.journal_path, "w") as f:
+                f.write(json.dumps({"generation": self._journal_generation}) + "\n")
+
+        # The attempt is embedded as pydantic's own JSON (no intermediate dict)
+        with open(self.journal_path, "a") as f:
+            f.write(
+                f'{{"seed": {seed}, "difficulty": {json.dumps(difficulty)}, '
+                f'"attempt": {attempt.model_dump_json()}}}\n'
+            )
 
         return is_improvement, is_regression, is_new_best
 
@@ -95,20 +188,21 @@ class ProgressTracker:
         recent = scenario.attempts[-5:]
         lines.append("[bold]Recent History:[/bold]")
 
+        # Position of the first shown attempt in the kept list
+        first_pos = len(scenario.attempts) - len(recent)
+
         for i, attempt in enumerate(recent):
-            # Calculate relative index from the full list
+            # Calculate relative index from all attempts ever recorded
             idx = scenario.attempt_count - len(recent) + i + 1
             pct = attempt.percentage
 
             # Progress bar
-            bar_width = 20
-            filled = int(pct / 100 * bar_width)
-            bar = "█" * filled + "░" * (bar_width - filled)
+            bar = _BARS[min(int(pct / 100 * BAR_WIDTH), BAR_WIDTH)]
 
             # Determine if this was an improvement
             marker = ""
-            if idx > 1:
-                prev = scenario.attempts[scenario.attempt_count - len(recent) + i - 1]
+            if first_pos + i > 0:
+                prev = scenario.attempts[first_pos + i - 1]
                 if attempt.percentage > prev.percentage:
                     marker = " [green]+{:.0f}%[/green]".format(attempt.percentage - prev.percentage)
                 elif attempt.percentage < prev.percentage:
@@ -121,14 +215,12 @@ class ProgressTracker:
 
         # Time info
         if scenario.last_attempt:
-            from datetime import datetime
-            diff = datetime.now() - scenario.last_attempt
-            if diff.days > 0:
-                time_ago = f"{diff.days} days ago"
-            elif diff.seconds > 3600:
-                time_ago = f"{diff.seconds // 3600} hours ago"
-            elif diff.seconds > 60:
-                time_ago = f"{diff.seconds // 60} minutes ago"
+            # Attempt timestamps are naive local times, as is timestamp()'s reading
+            elapsed = int(time.time() - scenario.last_attempt.timestamp())
+            for seconds, unit in _TIME_BUCKETS:
+                if elapsed >= seconds:
+                    time_ago = f"{elapsed // seconds} {unit} ago"
+                    break
             else:
                 time_ago = "just now"
             lines.append(f"\n[dim]Last attempt: {time_ago}[/dim]")
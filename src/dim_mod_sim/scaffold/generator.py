@@ -10,10 +10,123 @@ from dim_mod_sim.shop.options import (
     ProductHierarchyChangeFrequency,
     PromotionsPerLineItem,
     ReturnsReferencePolicy,
+    TimestampBusinessDateRelation,
     TransactionGrain,
 )
 
 
+# TODOs whose text does not depend on the config; shared by every scaffold
+_TODO_MIXED_GRAIN = ScaffoldTodo(
+    location="fact_sales.grain_description",
+    question="How will you handle mixed line-item and receipt-level transactions?",
+    hints=(
+        "Option 1: Separate fact tables (fact_sales_line, fact_sales_receipt)",
+        "Option 2: Lowest common grain with is_aggregated flag",
+        "Option 3: Always use line-item grain, synthesize lines for receipts",
+    ),
+    decision_type="grain",
+)
+
+_TODO_MULTIPLE_PAYMENTS = ScaffoldTodo(
+    location="fact_sales",
+    question="How will you model multiple payments per transaction?",
+    hints=(
+        "Option 1: Separate fact_payments table",
+        "Option 2: Bridge table between fact_sales and dim_payment_method",
+        "Option 3: Denormalized payment columns (payment_1, payment_2...)",
+    ),
+    decision_type="relationship",
+)
+
+_TODO_OPTIONAL_RETURN_REFERENCE = ScaffoldTodo(
+    location="fact_returns.original_transaction_id",
+    question="How will you handle returns that don't reference original transactions?",
+    hints=(
+        "Nullable FK to fact_sales",
+        "Separate handling for orphan returns",
+        "Special 'unknown_transaction' surrogate",
+    ),
+    decision_type="relationship",
+)
+
+_TODO_INVENTORY_BOTH = ScaffoldTodo(
+    location="inventory",
+    question="How do transactional and snapshot inventory facts relate?",
+    hints=(
+        "Transactional: individual movements",
+        "Snapshot: point-in-time balances",
+        "They serve different query patterns",
+    ),
+    decision_type="grain",
+)
+
+_TODO_DUAL_DATES = ScaffoldTodo(
+    location="dim_date",
+    question="How will you track both event timestamp and business effective date?",
+    hints=(
+        "Option 1: Two date dimension FKs (event_date_key, business_date_key)",
+        "Option 2: Store business_date in fact, join to dim_date for reporting",
+        "Consider which date matters for which queries",
+    ),
+    decision_type="temporal",
+)
+
+_TODO_SKU_REUSE = ScaffoldTodo(
+    location="dim_product.natural_key",
+    question="SKUs are reused. Is SKU alone sufficient as natural key?",
+    hints=(
+        "May need composite key: sku + effective_from_date",
+        "Or use surrogate key and track SKU history",
+        "Current setup will conflate different products with same SKU",
+    ),
+    decision_type="identity",
+)
+
+_TODO_STORE_LIFECYCLE = ScaffoldTodo(
+    location="dim_store.scd_strategy",
+    question="Stores have lifecycle changes. How to track store history?",
+    hints=(
+        "Type 2 SCD to track openings, closings, merges",
+        "Store merges are particularly tricky",
+        "Consider how to attribute historical sales after a merge",
+    ),
+    decision_type="scd",
+)
+
+_TODO_UNRELIABLE_CUSTOMER_IDS = ScaffoldTodo(
+    location="dim_customer",
+    question="Customer IDs are unreliable. How to handle identity issues?",
+    hints=(
+        "Consider fuzzy matching / identity resolution",
+        "May need a customer_alias bridge table",
+        "Accept some data quality issues or clean upstream",
+    ),
+    decision_type="identity",
+)
+
+_TODO_HOUSEHOLDS = ScaffoldTodo(
+    location="dim_customer.household_id",
+    question="Customers are grouped into households. How to model this?",
+    hints=(
+        "Simple: household_id attribute in dim_customer",
+        "Complex: separate dim_household with relationship",
+        "Households can change over time - consider SCD",
+    ),
+    decision_type="relationship",
+)
+
+_TODO_PROMOTION_BRIDGE = ScaffoldTodo(
+    location="relationships",
+    question="Multiple promotions per line item - how to model?",
+    hints=(
+        "Bridge table: bridge_sales_promotion",
+        "Separate promotion fact table",
+        "Array/JSON column (limited queryability)",
+    ),
+    decision_type="relationship",
+)
+
+
 class ScaffoldGenerator:
     """Generates schema scaffolds from shop configurations.
 
@@ -49,7 +162,8 @@ class ScaffoldGenerator:
 
     def _add_sales_fact(self, scaffold: ScaffoldedSchema) -> None:
         """Add sales fact table scaffold."""
-        grain = self.config.transactions.grain
+        transactions = self.config.transactions
+        grain = transactions.grain
 
         # Intentionally questionable grain columns
         grain_columns = [
@@ -81,16 +195,7 @@ class ScaffoldGenerator:
         if grain == TransactionGrain.MIXED:
             fact["grain_description"] = "TODO: Define grain - shop uses MIXED transaction levels!"
             fact["_warning"] = "Mixed grain is tricky - consider separate facts per grain"
-            scaffold.todos.append(ScaffoldTodo(
-                location="fact_sales.grain_description",
-                question="How will you handle mixed line-item and receipt-level transactions?",
-                hints=[
-                    "Option 1: Separate fact tables (fact_sales_line, fact_sales_receipt)",
-                    "Option 2: Lowest common grain with is_aggregated flag",
-                    "Option 3: Always use line-item grain, synthesize lines for receipts",
-                ],
-                decision_type="grain",
-            ))
+            scaffold.todos.append(_TODO_MIXED_GRAIN)
         elif grain == TransactionGrain.LINE_ITEM_LEVEL:
             fact["grain_description"] = "TODO: One row per line item sold"
         else:
@@ -99,24 +204,16 @@ class ScaffoldGenerator:
             fact["grain_columns"] = [gc for gc in grain_columns if gc["name"] != "line_number"]
 
         # Multiple payments TODO
-        if self.config.transactions.multiple_payments:
+        if transactions.multiple_payments:
             fact["_todo_payments"] = "Multiple payments per transaction - consider separate payment fact"
-            scaffold.todos.append(ScaffoldTodo(
-                location="fact_sales",
-                question="How will you model multiple payments per transaction?",
-                hints=[
-                    "Option 1: Separate fact_payments table",
-                    "Option 2: Bridge table between fact_sales and dim_payment_method",
-                    "Option 3: Denormalized payment columns (payment_1, payment_2...)",
-                ],
-                decision_type="relationship",
-            ))
+            scaffold.todos.append(_TODO_MULTIPLE_PAYMENTS)
 
         scaffold.fact_tables.append(fact)
 
     def _add_returns_fact(self, scaffold: ScaffoldedSchema) -> None:
         """Add returns fact table scaffold if returns are enabled."""
-        if self.config.returns.reference_policy == ReturnsReferencePolicy.NEVER:
+        reference_policy = self.config.returns.reference_policy
+        if reference_policy == ReturnsReferencePolicy.NEVER:
             return
 
         fact = {
@@ -134,34 +231,26 @@ class ScaffoldGenerator:
         }
 
         # Original transaction reference
-        if self.config.returns.reference_policy == ReturnsReferencePolicy.ALWAYS:
+        if reference_policy == ReturnsReferencePolicy.ALWAYS:
             fact["grain_columns"].append({
                 "name": "original_transaction_id",
                 "references_dimension": None,
                 "is_degenerate": True,
             })
             fact["_todo_original_ref"] = "Always has original transaction - consider FK to fact_sales"
-        elif self.config.returns.reference_policy == ReturnsReferencePolicy.SOMETIMES:
+        elif reference_policy == ReturnsReferencePolicy.SOMETIMES:
             fact["_warning"] = "Returns SOMETIMES reference original sales - handle NULLs!"
-            scaffold.todos.append(ScaffoldTodo(
-                location="fact_returns.original_transaction_id",
-                question="How will you handle returns that don't reference original transactions?",
-                hints=[
-                    "Nullable FK to fact_sales",
-                    "Separate handling for orphan returns",
-                    "Special 'unknown_transaction' surrogate",
-                ],
-                decision_type="relationship",
-            ))
+            scaffold.todos.append(_TODO_OPTIONAL_RETURN_REFERENCE)
 
         scaffold.fact_tables.append(fact)
 
     def _add_inventory_fact(self, scaffold: ScaffoldedSchema) -> None:
         """Add inventory fact table scaffold if inventory is tracked."""
-        if not self.config.inventory.tracked:
+        inventory = self.config.inventory
+        if not inventory.tracked:
             return
 
-        inv_type = self.config.inventory.inventory_type
+        inv_type = inventory.inventory_type
 
         if inv_type in (InventoryType.TRANSACTIONAL, InventoryType.BOTH):
             scaffold.fact_tables.append({
@@ -193,16 +282,7 @@ class ScaffoldGenerator:
             })
 
         if inv_type == InventoryType.BOTH:
-            scaffold.todos.append(ScaffoldTodo(
-                location="inventory",
-                question="How do transactional and snapshot inventory facts relate?",
-                hints=[
-                    "Transactional: individual movements",
-                    "Snapshot: point-in-time balances",
-                    "They serve different query patterns",
-                ],
-                decision_type="grain",
-            ))
+            scaffold.todos.append(_TODO_INVENTORY_BOTH)
 
     def _add_date_dimension(self, scaffold: ScaffoldedSchema) -> None:
         """Add date dimension scaffold."""
@@ -224,24 +304,16 @@ class ScaffoldGenerator:
         }
 
         # Timestamp vs business date handling
-        if self.config.time.timestamp_business_date_relation.value == "different":
+        if self.config.time.timestamp_business_date_relation == TimestampBusinessDateRelation.DIFFERENT:
             dim["_warning"] = "Timestamps differ from business dates - you may need TWO date FKs!"
-            scaffold.todos.append(ScaffoldTodo(
-                location="dim_date",
-                question="How will you track both event timestamp and business effective date?",
-                hints=[
-                    "Option 1: Two date dimension FKs (event_date_key, business_date_key)",
-                    "Option 2: Store business_date in fact, join to dim_date for reporting",
-                    "Consider which date matters for which queries",
-                ],
-                decision_type="temporal",
-            ))
+            scaffold.todos.append(_TODO_DUAL_DATES)
 
         scaffold.dimension_tables.append(dim)
 
     def _add_product_dimension(self, scaffold: ScaffoldedSchema) -> None:
         """Add product dimension scaffold."""
-        hierarchy_freq = self.config.products.hierarchy_change_frequency
+        products = self.config.products
+        hierarchy_freq = products.hierarchy_change_frequency
 
         # Intentionally questionable SCD choice
         scd_strategy = "type_1"  # WRONG for changing hierarchies
@@ -263,36 +335,29 @@ class ScaffoldGenerator:
 
         # Add warnings for traps
         if hierarchy_freq != ProductHierarchyChangeFrequency.NONE:
-            dim["_warning"] = f"Product hierarchy changes {hierarchy_freq.value} - Type 1 loses history!"
+            frequency = hierarchy_freq.value
+            dim["_warning"] = f"Product hierarchy changes {frequency} - Type 1 loses history!"
             dim["_todo_scd"] = "Consider Type 2 SCD for category/subcategory tracking"
             scaffold.todos.append(ScaffoldTodo(
                 location="dim_product.scd_strategy",
-                question=f"Product categories change {hierarchy_freq.value}. What SCD strategy?",
-                hints=[
+                question=f"Product categories change {frequency}. What SCD strategy?",
+                hints=(
                     "Type 1: Overwrite (loses history)",
                     "Type 2: Add rows (preserves history, needs effective dates)",
                     "Consider marking category attributes as scd_tracked: true",
-                ],
+                ),
                 decision_type="scd",
             ))
 
-        if self.config.products.sku_reuse:
+        if products.sku_reuse:
             dim["_warning_sku"] = "SKU codes are REUSED for different products over time!"
-            scaffold.todos.append(ScaffoldTodo(
-                location="dim_product.natural_key",
-                question="SKUs are reused. Is SKU alone sufficient as natural key?",
-                hints=[
-                    "May need composite key: sku + effective_from_date",
-                    "Or use surrogate key and track SKU history",
-                    "Current setup will conflate different products with same SKU",
-                ],
-                decision_type="identity",
-            ))
+            scaffold.todos.append(_TODO_SKU_REUSE)
 
         scaffold.dimension_tables.append(dim)
 
     def _add_store_dimension(self, scaffold: ScaffoldedSchema) -> None:
         """Add store dimension scaffold."""
+        stores = self.config.stores
         dim: dict[str, Any] = {
             "name": "dim_store",
             "natural_key": ["store_id"],
@@ -305,35 +370,27 @@ class ScaffoldGenerator:
             ],
         }
 
-        if self.config.stores.physical_stores:
+        if stores.physical_stores:
             dim["attributes"].extend([
                 {"name": "address", "data_type": "varchar"},
                 {"name": "city", "data_type": "varchar"},
                 {"name": "state", "data_type": "varchar"},
             ])
 
-        if self.config.stores.store_lifecycle_changes:
+        if stores.store_lifecycle_changes:
             dim["_warning"] = "Stores open, close, and merge - Type 1 loses this history!"
             dim["attributes"].extend([
                 {"name": "open_date", "data_type": "date"},
                 {"name": "close_date", "data_type": "date", "_note": "nullable"},
             ])
-            scaffold.todos.append(ScaffoldTodo(
-                location="dim_store.scd_strategy",
-                question="Stores have lifecycle changes. How to track store history?",
-                hints=[
-                    "Type 2 SCD to track openings, closings, merges",
-                    "Store merges are particularly tricky",
-                    "Consider how to attribute historical sales after a merge",
-                ],
-                decision_type="scd",
-            ))
+            scaffold.todos.append(_TODO_STORE_LIFECYCLE)
 
         scaffold.dimension_tables.append(dim)
 
     def _add_customer_dimension(self, scaffold: ScaffoldedSchema) -> None:
         """Add customer dimension scaffold if customers exist."""
-        reliability = self.config.customers.customer_id_reliability
+        customers = self.config.customers
+        reliability = customers.customer_id_reliability
 
         if reliability == CustomerIdReliability.ABSENT:
             scaffold.warnings.append(
@@ -354,56 +411,36 @@ class ScaffoldGenerator:
 
         if reliability == CustomerIdReliability.UNRELIABLE:
             dim["_warning"] = "Customer IDs are UNRELIABLE - may merge, split, or be duplicated!"
-            scaffold.todos.append(ScaffoldTodo(
-                location="dim_customer",
-                question="Customer IDs are unreliable. How to handle identity issues?",
-                hints=[
-                    "Consider fuzzy matching / identity resolution",
-                    "May need a customer_alias bridge table",
-                    "Accept some data quality issues or clean upstream",
-                ],
-                decision_type="identity",
-            ))
+            scaffold.todos.append(_TODO_UNRELIABLE_CUSTOMER_IDS)
 
-        if self.config.customers.anonymous_allowed:
+        if customers.anonymous_allowed:
             dim["_note_anonymous"] = "Anonymous customers allowed - handle NULL/unknown customer"
             dim["attributes"].append({"name": "is_anonymous", "data_type": "boolean"})
 
-        if self.config.customers.household_grouping:
+        if customers.household_grouping:
             dim["attributes"].append({
                 "name": "household_id",
                 "data_type": "varchar",
                 "_todo": "Households can change - track history?",
             })
-            scaffold.todos.append(ScaffoldTodo(
-                location="dim_customer.household_id",
-                question="Customers are grouped into households. How to model this?",
-                hints=[
-                    "Simple: household_id attribute in dim_customer",
-                    "Complex: separate dim_household with relationship",
-                    "Households can change over time - consider SCD",
-                ],
-                decision_type="relationship",
-            ))
+            scaffold.todos.append(_TODO_HOUSEHOLDS)
 
         scaffold.dimension_tables.append(dim)
 
     def _add_relationships(self, scaffold: ScaffoldedSchema) -> None:
         """Add relationships between facts and dimensions."""
-        # Get fact and dimension names
-        fact_names = [f["name"] for f in scaffold.fact_tables]
-        dim_names = [d["name"] for d in scaffold.dimension_tables]
+        dim_names = frozenset(d["name"] for d in scaffold.dimension_tables)
+        append = scaffold.relationships.append
 
-        for fact_name in fact_names:
-            fact = next(f for f in scaffold.fact_tables if f["name"] == fact_name)
-            dim_keys = fact.get("dimension_keys", [])
+        for fact in scaffold.fact_tables:
+            fact_name = fact["name"]
 
-            for dim_key in dim_keys:
+            for dim_key in fact.get("dimension_keys", ()):
                 # Derive dimension name from key
-                dim_name = f"dim_{dim_key.replace('_key', '')}"
+                dim_name = f"dim_{dim_key.removesuffix('_key')}"
 
                 if dim_name in dim_names:
-                    scaffold.relationships.append({
+                    append({
                         "fact_table": fact_name,
                         "dimension_table": dim_name,
                         "fact_column": dim_key,
@@ -413,25 +450,17 @@ class ScaffoldGenerator:
 
         # Promotion many-to-many
         if self.config.promotions.promotions_per_line_item == PromotionsPerLineItem.MANY:
-            scaffold.todos.append(ScaffoldTodo(
-                location="relationships",
-                question="Multiple promotions per line item - how to model?",
-                hints=[
-                    "Bridge table: bridge_sales_promotion",
-                    "Separate promotion fact table",
-                    "Array/JSON column (limited queryability)",
-                ],
-                decision_type="relationship",
-            ))
+            scaffold.todos.append(_TODO_PROMOTION_BRIDGE)
 
     def _add_global_warnings(self, scaffold: ScaffoldedSchema) -> None:
         """Add global warnings based on configuration."""
-        if self.config.transactions.voids_enabled:
+        transactions = self.config.transactions
+        if transactions.voids_enabled:
             scaffold.warnings.append(
                 "Voids are enabled - decide how to track or exclude voided transactions"
             )
 
-        if self.config.transactions.manual_overrides:
+        if transactions.manual_overrides:
             scaffold.warnings.append(
                 "Manual price overrides allowed - original vs override price tracking?"
             )
@@ -1,20 +1,42 @@
 """Scaffold models for schema skeleton generation."""
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Any
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScaffoldTodo:
-    """A TODO comment for the scaffold indicating a modeling decision."""
+    """A TODO comment for the scaffold indicating a modeling decision.
+
+    Immutable, so identical TODOs can be shared between scaffolds. The JSON
+    form is built once, read-only, and copied out by as_dict().
+    """
 
     location: str  # e.g., "fact_sales.grain_columns"
     question: str  # The modeling decision question
-    hints: list[str] = field(default_factory=list)  # Hints based on shop config
+    hints: tuple[str, ...] = ()  # Hints based on shop config
     decision_type: str = "general"  # grain, scd, relationship, measure
+    _as_dict: Mapping[str, Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_as_dict", MappingProxyType({
+            "location": self.location,
+            "question": self.question,
+            "hints": self.hints,
+            "decision_type": self.decision_type,
+        }))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the TODO as a fresh dict for JSON serialization.
+
+        Hints stay a tuple, so the copy shares nothing mutable with the TODO.
+        """
+        return dict(self._as_dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScaffoldedSchema:
     """A scaffolded schema with intentional gaps and warnings."""
 
@@ -36,15 +58,7 @@ class ScaffoldedSchema:
 
         # Add todos as comments in the output
         if self.todos:
-            result["_scaffold_todos"] = [
-                {
-                    "location": todo.location,
-                    "question": todo.question,
-                    "hints": todo.hints,
-                    "decision_type": todo.decision_type,
-                }
-                for todo in self.todos
-            ]
+            result["_scaffold_todos"] = [todo.as_dict() for todo in self.todos]
 
         if self.warnings:
             result["_scaffold_warnings"] = self.warnings
@@ -1,9 +1,9 @@
 """Schema submission models."""
 
 from enum import Enum
-from typing import Any
+from typing import Any, Self
 
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import BaseModel, ConfigDict, PrivateAttr, field_validator
 
 
 class SCDType(str, Enum):
@@ -143,25 +143,49 @@ class SchemaSubmission(BaseModel):
             raise ValueError("Schema must have at least one fact table")
         return v
 
+    # Name indices for the get_* lookups below. The first table with a given
+    # name wins, matching a linear scan.
+    _fact_tables_by_name: dict[str, FactTable] = PrivateAttr(default_factory=dict)
+    _dimension_tables_by_name: dict[str, DimensionTable] = PrivateAttr(default_factory=dict)
+    _relationships_by_fact: dict[str, list[Relationship]] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._build_indices()
+
+    def model_copy(self, *, update: dict[str, Any] | None = None, deep: bool = False) -> Self:
+        # model_copy skips model_post_init and carries the private indices
+        # over, so rebuild them from the copy's own tables.
+        copied = super().model_copy(update=update, deep=deep)
+        copied._build_indices()
+        return copied
+
+    def _build_indices(self) -> None:
+        facts: dict[str, FactTable] = {}
+        for ft in self.fact_tables:
+            facts.setdefault(ft.name, ft)
+        dims: dict[str, DimensionTable] = {}
+        for dt in self.dimension_tables:
+            dims.setdefault(dt.name, dt)
+        rels: dict[str, list[Relationship]] = {}
+        for r in self.relationships:
+            rels.setdefault(r.fact_table, []).append(r)
+        self._fact_tables_by_name = facts
+        self._dimension_tables_by_name = dims
+        self._relationships_by_fact = rels
+
     def get_fact_table(self, name: str) -> FactTable | None:
         """Get a fact table by name."""
-        for ft in self.fact_tables:
-            if ft.name == name:
-                return ft
-        return None
+        return self._fact_tables_by_name.get(name)
 
     def get_dimension_table(self, name: str) -> DimensionTable | None:
         """Get a dimension table by name."""
-        for dt in self.dimension_tables:
-            if dt.name == name:
-                return dt
-        return None
+        return self._dimension_tables_by_name.get(name)
 
     def get_relationships_for_fact(self, fact_name: str) -> list[Relationship]:
         """Get all relationships for a fact table."""
-        return [r for r in self.relationships if r.fact_table == fact_name]
+        return list(self._relationships_by_fact.get(fact_name, ()))
 
     def get_dimensions_for_fact(self, fact_name: str) -> list[DimensionTable]:
         """Get all dimensions connected to a fact table."""
-        dim_names = {r.dimension_table for r in self.get_relationships_for_fact(fact_name)}
+        dim_names = {r.dimension_table for r in self._relationships_by_fact.get(fact_name, ())}
         return [dt for dt in self.dimension_tables if dt.name in dim_names]
@@ -1,6 +1,5 @@
 """JSON schema parser."""
 
-import json
 from pathlib import Path
 
 from dim_mod_sim.schema.models import SchemaSubmission
@@ -9,6 +8,9 @@ from dim_mod_sim.schema.models import SchemaSubmission
 def parse_schema(source: str | Path | dict) -> SchemaSubmission:
     """Parse a schema submission from various sources.
 
+    JSON text (from a file or a string) is handed straight to pydantic's
+    native JSON validation rather than going through json.loads first.
+
     Args:
         source: JSON string, file path, or dictionary
 
@@ -16,19 +18,18 @@ def parse_schema(source: str | Path | dict) -> SchemaSubmission:
         Validated SchemaSubmission
     """
     if isinstance(source, dict):
-        data = source
+        return SchemaSubmission.model_validate(source)
     elif isinstance(source, Path):
-        with open(source) as f:
-            data = json.load(f)
+        return SchemaSubmission.model_validate_json(source.read_bytes())
     elif isinstance(source, str):
+        # A JSON object can't be a file path; skip the filesystem check
+        if source.lstrip().startswith("{"):
+            return SchemaSubmission.model_validate_json(source)
+
         # Try as file path first, then as JSON string
         path = Path(source)
         if path.exists():
-            with open(path) as f:
-                data = json.load(f)
-        else:
-            data = json.loads(source)
+            return SchemaSubmission.model_validate_json(path.read_bytes())
+        return SchemaSubmission.model_validate_json(source)
     else:
         raise TypeError(f"Unsupported source type: {type(source)}")
-
-    return SchemaSubmission.model_validate(data)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from dim_mod_sim.core.random import SeededRandom
@@ -417,6 +418,12 @@ def extract_enabled_traps(config: ShopConfiguration) -> list["EnabledTrap"]:
     This analyzes the configuration and identifies which traps are active
     that could trip up a naive dimensional modeler.
     """
+    return list(_extract_enabled_traps(config))
+
+
+@lru_cache(maxsize=32)
+def _extract_enabled_traps(config: ShopConfiguration) -> tuple["EnabledTrap", ...]:
+    """Scan a configuration for traps, cached per (frozen, hashable) config."""
     from dim_mod_sim.play.framing import EnabledTrap, TrapCategory
 
     traps: list[EnabledTrap] = []
@@ -579,4 +586,4 @@ def extract_enabled_traps(config: ShopConfiguration) -> list["EnabledTrap"]:
             config_source="products.bundled_products=true",
         ))
 
-    return traps
+    return tuple(traps)
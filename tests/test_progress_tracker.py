@@ -0,0 +1,68 @@
+"""Tests for the progress tracker's attempt journal."""
+
+import json
+from pathlib import Path
+
+from dim_mod_sim.evaluator.result import EvaluationResult
+from dim_mod_sim.progress.models import ProgressStore
+from dim_mod_sim.progress.tracker import ProgressTracker
+
+
+def _record(tracker: ProgressTracker, score: int) -> None:
+    result = EvaluationResult(total_score=score, max_possible_score=100)
+    tracker.record_attempt(1, "easy", result, {"score": score})
+
+
+def test_unflushed_journal_is_replayed(tmp_path: Path) -> None:
+    path = tmp_path / "progress.json"
+    tracker = ProgressTracker(path)
+    _record(tracker, 40)
+    _record(tracker, 60)
+
+    scenario = ProgressTracker(path).get_scenario(1, "easy")
+
+    assert scenario is not None
+    assert scenario.attempt_count == 2
+    assert scenario.best_score == 60
+
+
+def test_flush_interrupted_before_journal_delete_is_not_replayed(tmp_path: Path) -> None:
+    path = tmp_path / "progress.json"
+    tracker = ProgressTracker(path)
+    _record(tracker, 40)
+    journal = tracker.journal_path.read_bytes()
+    tracker.flush()
+    # Simulate a crash between saving the store and deleting the journal
+    tracker.journal_path.write_bytes(journal)
+
+    reloaded = ProgressTracker(path)
+
+    assert reloaded.get_scenario(1, "easy").attempt_count == 1
+    assert not reloaded.journal_path.exists()
+
+
+def test_replay_skips_malformed_entries(tmp_path: Path) -> None:
+    path = tmp_path / "progress.json"
+    tracker = ProgressTracker(path)
+    _record(tracker, 40)
+    entry = json.loads(tracker.journal_path.read_text().splitlines()[-1])
+    del entry["seed"]
+    with open(tracker.journal_path, "a") as f:
+        f.write(json.dumps(entry) + '\n[1, 2]\n{"attempt": {}}\n{"se')
+
+    scenario = ProgressTracker(path).get_scenario(1, "easy")
+
+    assert scenario.attempt_count == 1
+
+
+def test_attempts_after_flush_start_a_new_journal(tmp_path: Path) -> None:
+    path = tmp_path / "progress.json"
+    tracker = ProgressTracker(path)
+    _record(tracker, 40)
+    tracker.flush()
+    _record(tracker, 70)
+
+    reloaded = ProgressTracker(path)
+
+    assert reloaded.get_scenario(1, "easy").attempt_count == 2
+    assert ProgressStore.load(path).get_scenario(1, "easy").attempt_count == 1
@@ -0,0 +1,83 @@
+"""Tests for schema submission models."""
+
+from dim_mod_sim.schema.models import (
+    DimensionTable,
+    FactTable,
+    GrainColumn,
+    Relationship,
+    SCDType,
+    SchemaSubmission,
+)
+
+
+def _schema() -> SchemaSubmission:
+    return SchemaSubmission(
+        fact_tables=[
+            FactTable(
+                name="fact_sales",
+                grain_description="One row per line item",
+                grain_columns=[GrainColumn(name="transaction_id")],
+                measures=[],
+                dimension_keys=["product_key"],
+            ),
+            FactTable(
+                name="fact_returns",
+                grain_description="One row per return line",
+                grain_columns=[GrainColumn(name="return_id")],
+                measures=[],
+                dimension_keys=["product_key"],
+            ),
+        ],
+        dimension_tables=[
+            DimensionTable(
+                name="dim_product",
+                natural_key=["sku"],
+                surrogate_key="product_key",
+                scd_strategy=SCDType.TYPE_1,
+                attributes=[],
+            ),
+        ],
+        relationships=[
+            Relationship(
+                fact_table="fact_sales",
+                dimension_table="dim_product",
+                fact_column="product_key",
+                dimension_column="product_key",
+            ),
+        ],
+    )
+
+
+def test_lookups_by_name() -> None:
+    schema = _schema()
+
+    assert schema.get_fact_table("fact_sales") is schema.fact_tables[0]
+    assert schema.get_fact_table("fact_missing") is None
+    assert schema.get_dimension_table("dim_product") is schema.dimension_tables[0]
+    assert schema.get_relationships_for_fact("fact_sales") == schema.relationships
+    assert schema.get_dimensions_for_fact("fact_sales") == schema.dimension_tables
+    assert schema.get_dimensions_for_fact("fact_returns") == []
+
+
+def test_model_copy_update_rebuilds_lookups() -> None:
+    schema = _schema()
+    schema.get_fact_table("fact_sales")
+
+    copied = schema.model_copy(update={
+        "fact_tables": schema.fact_tables[1:],
+        "relationships": [],
+    })
+
+    assert copied.get_fact_table("fact_sales") is None
+    assert copied.get_fact_table("fact_returns") is copied.fact_tables[0]
+    assert copied.get_relationships_for_fact("fact_sales") == []
+    assert schema.get_fact_table("fact_sales") is schema.fact_tables[0]
+
+
+def test_indices_do_not_affect_equality_or_dump() -> None:
+    schema = _schema()
+
+    assert schema == _schema()
+    assert set(schema.model_dump()) == {
+        "fact_tables", "dimension_tables", "relationships", "bridge_tables",
+    }